@@ -62,6 +62,13 @@ except ImportError:
         return logger
 
 
+# Decoded sample data by file path, shared by every SoundManager so the
+# game does not decode the files again after the menu already did. Only the
+# raw samples are shared: each manager wraps them in its own Sound, so
+# set_sfx_volume on one manager does not change the others.
+_SOUND_CACHE = {}
+
+
 class SoundManager:
     """Class for managing game sounds and music"""
 
@@ -127,8 +134,14 @@ class SoundManager:
 
                 if file_path.exists():
                     try:
-                        self.sounds[sound_name] = pygame.mixer.Sound(str(file_path))
-                        self.sounds[sound_name].set_volume(self.sfx_volume)
+                        samples = _SOUND_CACHE.get(str(file_path))
+                        if samples is None:
+                            sound = pygame.mixer.Sound(str(file_path))
+                            _SOUND_CACHE[str(file_path)] = sound.get_raw()
+                        else:
+                            sound = pygame.mixer.Sound(buffer=samples)
+                        self.sounds[sound_name] = sound
+                        sound.set_volume(self.sfx_volume)
                     except Exception as e:
                         self.logger.error(f"Error loading sound {file_name}: {e}")
                 else:
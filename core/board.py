@@ -82,26 +82,26 @@ class Board:
     def create_surfaces(self):
         """Create rendering surfaces with error handling"""
         try:
-            # Main board surface
+            # Main board surface (opaque, it is filled black every frame, so it
+            # uses the display format and blits without per-pixel blending)
             self.board_surface = pygame.Surface(
-                (self.width * GRID_SIZE, self.height * GRID_SIZE), pygame.SRCALPHA
-            )
+                (self.width * GRID_SIZE, self.height * GRID_SIZE)
+            ).convert()
 
-            # Border surface
+            # Border surface (opaque as well, fully covered by _draw_border)
             self.border_surface = pygame.Surface(
-                ((self.width + 2) * GRID_SIZE, (self.height + 2) * GRID_SIZE),
-                pygame.SRCALPHA,
-            )
+                ((self.width + 2) * GRID_SIZE, (self.height + 2) * GRID_SIZE)
+            ).convert()
 
             # Grid lines surface
             self.grid_surface = pygame.Surface(
                 (self.width * GRID_SIZE, self.height * GRID_SIZE), pygame.SRCALPHA
-            )
+            ).convert_alpha()
 
             # Glow effect surface
             self.glow_surface = pygame.Surface(
                 (self.width * GRID_SIZE, self.height * GRID_SIZE), pygame.SRCALPHA
-            )
+            ).convert_alpha()
 
         except pygame.error as e:
             self.logger.error(f"Error creating board surfaces: {e}")
@@ -140,6 +140,12 @@ class Board:
                 1,
             )
 
+        # Empty board (black with grid lines), copied into board_surface at the
+        # start of every frame instead of a fill plus an alpha-blended grid blit
+        self.board_background = self.board_surface.copy()
+        self.board_background.fill(BLACK)
+        self.board_background.blit(self.grid_surface, (0, 0))
+
     def _draw_border(self):
         """Draw board border on border_surface"""
         self.border_surface.fill(DARK_GRAY)
@@ -306,13 +312,10 @@ class Board:
             # Draw border
             surface.blit(self.border_surface, (self.x - GRID_SIZE, self.y - GRID_SIZE))
 
-            # Reset surfaces
-            self.board_surface.fill(BLACK)
+            # Reset surfaces (the board starts from the pre-drawn empty grid)
+            self.board_surface.blit(self.board_background, (0, 0))
             self.glow_surface.fill((0, 0, 0, 0))
 
-            # Draw grid
-            self.board_surface.blit(self.grid_surface, (0, 0))
-
             # Draw locked blocks
             for y in range(self.height):
                 for x in range(self.width):
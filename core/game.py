@@ -174,6 +174,12 @@ class Game:
         # Key states for continuous input
         self.key_states = {action: False for action in self.keys}
 
+        # Reverse lookup so each key event resolves its action with one dict access
+        self.key_actions = {}
+        for action, keys in self.keys.items():
+            for key in keys:
+                self.key_actions.setdefault(key, action)
+
     def reset_game(self):
         """Reset game to initial state"""
         self.state = STATE_PLAYING
@@ -232,6 +238,17 @@ class Game:
         piece_type = self.tetromino_bag.pop()
         return Tetromino(piece_type, x=(BOARD_WIDTH // 2) - 1, y=0)
 
+    def is_animating(self):
+        """Check whether the game needs to be redrawn without new input"""
+        return self.state != STATE_PAUSED
+
+    def handle_events(self, events):
+        """Handle all input events gathered for one frame"""
+        handled = False
+        for event in events:
+            handled = self.handle_event(event) or handled
+        return handled
+
     def handle_event(self, event):
         """Handle input events"""
         try:
@@ -250,19 +267,19 @@ class Game:
                 return False
 
             if event.type == pygame.KEYDOWN:
-                for action, keys in self.keys.items():
-                    if event.key in keys:
-                        self.key_states[action] = True
-                        return self._handle_key_action(action)
+                action = self.key_actions.get(event.key)
+                if action:
+                    self.key_states[action] = True
+                    return self._handle_key_action(action)
 
             elif event.type == pygame.KEYUP:
-                for action, keys in self.keys.items():
-                    if event.key in keys:
-                        self.key_states[action] = False
-                        if action in ["move_left", "move_right"]:
-                            self.das_timer = 0
-                            self.arr_timer = 0
-                        return True
+                action = self.key_actions.get(event.key)
+                if action:
+                    self.key_states[action] = False
+                    if action in ["move_left", "move_right"]:
+                        self.das_timer = 0
+                        self.arr_timer = 0
+                    return True
 
             return False
         except Exception as e:
@@ -674,7 +691,7 @@ class Game:
             if self.config.get("graphics", {}).get("bloom_effect", True):
                 self.renderer.apply_bloom(self.screen)
 
-            pygame.display.flip()
+            # The main loop presents the frame with a single display.flip()
 
         except Exception as e:
             self.logger.error(f"Error rendering game: {e}")
@@ -682,5 +699,4 @@ class Game:
             self.screen.fill((0, 0, 0))
             font = pygame.font.SysFont("Arial", 24)
             error_text = font.render("Rendering Error", True, (255, 0, 0))
-            self.screen.blit(error_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
-            pygame.display.flip()
\ No newline at end of file
+            self.screen.blit(error_text, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2))
\ No newline at end of file
@@ -26,7 +26,7 @@ except ImportError:
 try:
     from sqlalchemy import create_engine, event, text
     from sqlalchemy.orm import sessionmaker, scoped_session
-    from sqlalchemy.pool import QueuePool, StaticPool
+    from sqlalchemy.pool import QueuePool, StaticPool, NullPool
     from sqlalchemy.exc import SQLAlchemyError, OperationalError, DisconnectionError
     from sqlalchemy.engine import Engine
     import sqlite3
@@ -191,16 +191,22 @@ def create_sqlite_engine(db_config):
         with sqlite3.connect(db_path) as temp_conn:
             temp_conn.execute("SELECT 1")
         db_uri = f"sqlite:///{db_path}"
+        # A fresh connection per session, so the menu's worker threads never
+        # share one connection (WAL lets them read concurrently)
+        poolclass = NullPool
         logger.info(f"Using SQLite database at {db_path}")
     except Exception as e:
         logger.error(f"Cannot access SQLite at {db_path}: {e}")
         db_uri = "sqlite:///:memory:"
+        # Every new connection to :memory: is a separate empty database
+        poolclass = StaticPool
         logger.warning("Using in-memory SQLite as fallback")
 
     engine = create_engine(
         db_uri,
-        poolclass=StaticPool,
+        poolclass=poolclass,
         connect_args={
+            # The menu loads scores and logs in from worker threads
             "check_same_thread": False,
             "timeout": sqlite_config.get("pool_timeout", 20),
         },
@@ -257,7 +263,8 @@ def init_db():
 
         # Test connection
         with engine.connect() as conn:
-            if db_engine_type == "postgresql":
+            # Check the engine actually created, it may be the SQLite fallback
+            if engine.dialect.name == "postgresql":
                 conn.execute(text("SELECT version()"))
             else:
                 conn.execute(text("SELECT 1"))
@@ -284,7 +291,13 @@ def init_db():
         # Last resort: in-memory SQLite
         try:
             logger.info("Attempting last resort: in-memory SQLite...")
-            engine = create_engine("sqlite:///:memory:")
+            # One shared connection, so the menu's worker threads see the
+            # same in-memory database as the thread that created the tables
+            engine = create_engine(
+                "sqlite:///:memory:",
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+            )
             if Base is not None:
                 Base.metadata.create_all(engine)
             session_factory = sessionmaker(bind=engine)
@@ -9,6 +9,7 @@ Class for handling game rendering with modern effects
 
 import pygame
 import math
+import numpy as np
 from core.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
@@ -21,6 +22,38 @@ from core.constants import (
 )
 from graphics.effects import BloomEffect
 
+# Gradient background shared by all renderers, see _get_gradient
+_GRADIENT = None
+
+
+def _get_gradient():
+    """
+    Build the vertical gradient background once and share it
+
+    Returns:
+        pygame.Surface: Screen-sized gradient in the display format
+    """
+    global _GRADIENT
+    if _GRADIENT is None:
+        # One color per row, broadcast over all columns
+        # (pixel array is indexed [x, y, channel] like pygame.surfarray)
+        factor = 1 - np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT
+        row_colors = np.stack(
+            (
+                UI_BG[0] + factor * 15,
+                UI_BG[1] + factor * 10,
+                np.maximum(5, UI_BG[2] - factor * 10),
+            ),
+            axis=1,
+        ).astype(np.uint8)
+        pixels = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+        pixels[:] = row_colors
+
+        gradient = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.surfarray.blit_array(gradient, pixels)
+        _GRADIENT = gradient.convert()
+    return _GRADIENT
+
 
 class Renderer:
     """Handle game rendering and special effects"""
@@ -46,10 +79,15 @@ class Renderer:
             self.medium_font = pygame.font.Font(
                 f'assets/fonts/{config["ui"]["font"]}.ttf', 32
             )
-        except:
+        except (pygame.error, OSError, KeyError):
             self.large_font = pygame.font.SysFont("Arial", 48)
             self.medium_font = pygame.font.SysFont("Arial", 32)
 
+        # Glow surfaces are expensive to build, so keep them between frames
+        self._text_glows = {}
+        # Dimming overlays keyed by alpha, see _get_overlay
+        self._overlays = {}
+
     def render_background(self, level):
         """
         Render game background with subtle effects
@@ -57,23 +95,13 @@ class Renderer:
         Args:
             level (int): Current game level for color effects
         """
-        # Create gradient background
-        for y in range(SCREEN_HEIGHT):
-            # Calculate color based on y position
-            factor = 1 - (y / SCREEN_HEIGHT)
-            r = int(UI_BG[0] + factor * 15)
-            g = int(UI_BG[1] + factor * 10)
-            b = int(max(5, UI_BG[2] - factor * 10))
-            color = (r, g, b)
-
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
+        # Draw the pre-built gradient background
+        self.screen.blit(_get_gradient(), (0, 0))
 
     def render_pause_overlay(self):
         """Render pause screen overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(128), (0, 0))
 
         # Draw "PAUSED" text
         text = self.large_font.render("PAUSED", True, WHITE)
@@ -90,9 +118,7 @@ class Renderer:
             lines (int): Total lines cleared
         """
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(180), (0, 0))
 
         # Draw game over text
         y_pos = SCREEN_HEIGHT // 2 - 100
@@ -122,14 +148,12 @@ class Renderer:
             lines (int): Total lines cleared
         """
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(160), (0, 0))
 
         # Draw victory text with glow effect
         y_pos = SCREEN_HEIGHT // 2 - 100
         text = "VICTORY!"
-        glow_surf = self._create_text_glow(text, self.large_font, UI_HIGHLIGHT)
+        glow_surf = self._get_text_glow(text, self.large_font, UI_HIGHLIGHT)
         self.screen.blit(glow_surf, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
         self._render_centered_text(text, self.large_font, WHITE, y_pos)
 
@@ -158,20 +182,51 @@ class Renderer:
         text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
         self.screen.blit(text_surf, text_rect)
 
+    def _get_overlay(self, alpha):
+        """
+        Get a screen-sized black overlay, building it on first use
+
+        Built lazily rather than in __init__ so the display mode is set
+        before convert_alpha() runs.
+
+        Args:
+            alpha (int): Overlay opacity
+
+        Returns:
+            pygame.Surface: Overlay in the display's alpha format
+        """
+        overlay = self._overlays.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, alpha))
+            overlay = overlay.convert_alpha()
+            self._overlays[alpha] = overlay
+        return overlay
+
+    def _get_text_glow(self, text, font, color):
+        """Get the glow surface for text, building it on first use"""
+        key = (text, font, color)
+        glow = self._text_glows.get(key)
+        if glow is None:
+            glow = self._create_text_glow(text, font, color).convert_alpha()
+            self._text_glows[key] = glow
+        return glow
+
     def _create_text_glow(self, text, font, color):
         """Create glow effect for text"""
         text_surf = font.render(text, True, color)
         glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         text_rect = text_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        tx, ty = text_rect.topleft
 
+        # Collect every offset copy and draw them in one batched call
+        glow_blits = []
         for offset in range(1, 10):
             alpha = max(0, 255 - (offset * 25))
             glow_color = (*color, alpha)
             glow_surf = font.render(text, True, glow_color)
             for dx, dy in [(0, offset), (0, -offset), (offset, 0), (-offset, 0)]:
-                rect = text_rect.copy()
-                rect.x += dx
-                rect.y += dy
-                glow.blit(glow_surf, rect)
+                glow_blits.append((glow_surf, (tx + dx, ty + dy)))
+        glow.blits(glow_blits, doreturn=False)
 
         return glow
@@ -223,6 +223,7 @@ def load_config():
             "fullscreen": os.getenv("FULLSCREEN", "false").lower() == "true",
             "vsync": os.getenv("VSYNC", "true").lower() == "true",
             "target_fps": int(os.getenv("TARGET_FPS", "60")),
+            "idle_wait_ms": int(os.getenv("IDLE_WAIT_MS", "50")),
         },
         "game": {
             "difficulty": os.getenv("GAME_DIFFICULTY", "medium"),
@@ -613,8 +614,10 @@ def main():
         config = load_config()
         logger.info("Configuration loaded successfully")
 
-        # Initialize pygame
+        # Initialize pygame (pygame.init() also opens the mixer, so request the
+        # sound settings up front or SoundManager's would be ignored)
         logger.info("Initializing Pygame...")
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
         pygame.init()
 
         # Verify pygame initialization
@@ -678,6 +681,8 @@ def main():
 
         # Performance monitoring
         target_fps = config["screen"]["target_fps"]
+        # How long an idle scene may block waiting for input (0 disables)
+        idle_wait_ms = config["screen"].get("idle_wait_ms", 50)
         performance_warning_threshold = (
             target_fps * 0.8
         )  # Warn if FPS drops below 80% of target
@@ -694,8 +699,19 @@ def main():
                 # Limit delta time to prevent huge jumps
                 delta_time = min(delta_time, 1.0 / 20)  # Max 20 FPS minimum
 
-                # Process events
-                events = pygame.event.get()
+                # Process events. Scenes with nothing animating (e.g. a paused
+                # game) sleep until input arrives instead of spinning at full FPS
+                events = []
+                if (
+                    idle_wait_ms
+                    and current_scene
+                    and hasattr(current_scene, "is_animating")
+                    and not current_scene.is_animating()
+                ):
+                    event = pygame.event.wait(idle_wait_ms)
+                    if event.type != pygame.NOEVENT:
+                        events.append(event)
+                events.extend(pygame.event.get())
                 for event in events:
                     if event.type == pygame.QUIT:
                         running = False
@@ -729,13 +745,29 @@ def main():
                                 f"Fullscreen toggled: {config['screen']['fullscreen']}"
                             )
 
-                    # Pass event to current scene
-                    if current_scene and hasattr(current_scene, "handle_event"):
+                    # Pass event to scenes that handle events one at a time
+                    if (
+                        current_scene
+                        and not hasattr(current_scene, "handle_events")
+                        and hasattr(current_scene, "handle_event")
+                    ):
                         try:
                             current_scene.handle_event(event)
                         except Exception as e:
                             logger.error(f"Error handling event in scene: {e}")
 
+                # Pass the whole batch to scenes that accept it
+                if current_scene and hasattr(current_scene, "handle_events"):
+                    try:
+                        current_scene.handle_events(events)
+                    except Exception as e:
+                        logger.error(f"Error handling events in scene: {e}")
+
+                # Scenes ask to quit through a flag rather than a posted QUIT event
+                if getattr(current_scene, "should_quit", False):
+                    running = False
+                    logger.info("Quit requested by scene")
+
                 # Update current scene
                 if current_scene and hasattr(current_scene, "update"):
                     try:
@@ -0,0 +1,38 @@
+"""Smoke test: the main menu builds and draws a frame on every screen"""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+pygame = pytest.importorskip("pygame")
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def menu(monkeypatch):
+    # Assets and config are looked up relative to the project root
+    monkeypatch.chdir(ROOT)
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    config = yaml.safe_load((ROOT / "config.yaml").read_text())
+
+    from ui.menu import MainMenu
+
+    yield MainMenu(screen, config)
+    pygame.quit()
+
+
+@pytest.mark.parametrize(
+    "screen_name", ["main", "play", "register", "howto", "settings", "leaderboard"]
+)
+def test_menu_update_and_render(menu, screen_name):
+    menu.current_menu = screen_name
+    menu.handle_events(pygame.event.get())
+    menu.update(1 / 60)
+    menu.render()
@@ -19,6 +19,7 @@ except ImportError:
         import sys
 
         sys.exit(1)
+import functools
 import math
 import time
 
@@ -38,6 +39,32 @@ from core.constants import (
     DENSO_LIGHT_RED,
 )
 
+# Height of the title band above each HUD area
+PANEL_HEADER = 40
+
+
+@functools.lru_cache(maxsize=None)
+def _load_font(font_name, size):
+    """
+    Load a UI font once and share it between GameUI instances
+
+    Args:
+        font_name (str): Font file name in assets/fonts (without extension),
+            or None when no font is configured
+        size (int): Point size
+
+    Returns:
+        pygame.font.Font: Loaded font
+    """
+    pygame.font.init()
+    if font_name is not None:
+        try:
+            return pygame.font.Font(f"assets/fonts/{font_name}.ttf", size)
+        except (pygame.error, OSError):
+            pass
+    # Use system fonts if loading fails
+    return pygame.font.SysFont("Arial", size)
+
 
 class GameUI:
     """Class for in-game user interface"""
@@ -54,43 +81,80 @@ class GameUI:
         self.config = config
 
         # Import fonts
-        pygame.font.init()
-        try:
-            self.large_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', 36
-            )
-            self.medium_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', 24
+        font_name = config.get("ui", {}).get("font")
+        self.large_font = _load_font(font_name, 36)
+        self.medium_font = _load_font(font_name, 24)
+        self.small_font = _load_font(font_name, 18)
+
+        # UI area positions (relative to the side panel they are drawn on;
+        # the top PANEL_HEADER pixels of each panel hold the area title)
+        self.hold_area = pygame.Rect(0, PANEL_HEADER, 120, 120)
+        self.next_area = pygame.Rect(0, PANEL_HEADER, 120, 300)
+        self.score_area = pygame.Rect(0, PANEL_HEADER + 150, 120, 300)
+        self.progress_bar = pygame.Rect(
+            self.score_area.x + 10,
+            self.score_area.y + 255,
+            self.score_area.width - 20,
+            15,
+        )
+
+        # Pre-render static labels and their positions
+        self._labels = {}
+        self._label_rects = {}
+        for title, area in (
+            ("HOLD", self.hold_area),
+            ("NEXT", self.next_area),
+            ("STATS", self.score_area),
+        ):
+            self._labels[title] = self.medium_font.render(title, True, WHITE)
+            self._label_rects[title] = self._labels[title].get_rect(
+                center=(area.centerx, area.y - 20)
             )
-            self.small_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', 18
+
+        stat_y = self.score_area.y + 20
+        for name in ("Score:", "Level:", "Lines:", "Next Level:"):
+            self._labels[name] = self.small_font.render(name, True, WHITE)
+            self._label_rects[name] = self._labels[name].get_rect(
+                topleft=(self.score_area.x + 10, stat_y)
             )
-        except:
-            # Use system fonts if loading fails
-            self.large_font = pygame.font.SysFont("Arial", 36)
-            self.medium_font = pygame.font.SysFont("Arial", 24)
-            self.small_font = pygame.font.SysFont("Arial", 18)
+            stat_y += 70
 
-        # UI area positions
-        board_right = BOARD_X + BOARD_WIDTH * GRID_SIZE
-        self.hold_area = {"x": BOARD_X - 150, "y": BOARD_Y, "width": 120, "height": 120}
-        self.next_area = {
-            "x": board_right + 30,
-            "y": BOARD_Y,
-            "width": 120,
-            "height": 300,
-        }
-        self.score_area = {
-            "x": BOARD_X - 150,
-            "y": BOARD_Y + 150,
-            "width": 120,
-            "height": 300,
-        }
-
-        # Create surface for HUD
-        self.hud_surface = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        self._labels["copyright"] = self.small_font.render(
+            "© 2025 Thammaphon Chittasuwanna (SDM)", True, (150, 150, 150)
         )
+        self._label_rects["copyright"] = self._labels["copyright"].get_rect(
+            midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 5)
+        )
+
+        # Create side panel surfaces for HUD (only the columns beside the
+        # board are buffered, not the whole screen)
+        board_right = BOARD_X + BOARD_WIDTH * GRID_SIZE
+        self.left_panel = pygame.Surface(
+            (120, PANEL_HEADER + 450), pygame.SRCALPHA
+        ).convert_alpha()
+        self.left_panel_pos = (BOARD_X - 150, BOARD_Y - PANEL_HEADER)
+        self.right_panel = pygame.Surface(
+            (120, PANEL_HEADER + 300), pygame.SRCALPHA
+        ).convert_alpha()
+        self.right_panel_pos = (board_right + 30, BOARD_Y - PANEL_HEADER)
+
+        # Pre-rendered block sprites, keyed by (shape, color, cell size)
+        self._piece_sprites = {}
+
+        # Panel state drawn last frame (panels are reused while unchanged)
+        self._last_state_key = None
+
+        # Score/level/lines values with their screen positions. They are
+        # drawn on the screen rather than the fixed-width panel so long
+        # values can run past the panel edge instead of being clipped.
+        self._stat_blits = []
+
+        # Cached player/time labels
+        self._last_username = None
+        self._player_text = None
+        self._last_seconds = -1
+        self._time_text = None
+        self._time_rect = None
 
         # Animation timer
         self.animation_timer = 0
@@ -102,29 +166,84 @@ class GameUI:
         Args:
             data (dict): Game data (score, level, etc.)
         """
-        # Clear HUD surface
-        self.hud_surface.fill((0, 0, 0, 0))
-
-        # Draw Hold area
-        self._render_hold_area(data["hold_tetromino"], data["can_hold"])
-
-        # Draw Next area
-        self._render_next_area(data["next_tetrominos"])
-
-        # Draw Score area
-        self._render_score_area(data["score"], data["level"], data["lines"])
+        # Rebuild side panels only when something they show has changed
+        hold_tetromino = data["hold_tetromino"]
+        state_key = (
+            data["score"],
+            data["level"],
+            data["lines"],
+            hold_tetromino.shape_name if hold_tetromino else None,
+            data["can_hold"],
+            tuple(t.shape_name for t in data["next_tetrominos"]),
+        )
+        if state_key != self._last_state_key:
+            self._last_state_key = state_key
+
+            # Clear side panels and draw all frames with each panel locked
+            # once for the batch (blits below need the panels unlocked)
+            self.left_panel.lock()
+            self.right_panel.lock()
+            try:
+                self.left_panel.fill((0, 0, 0, 0))
+                self.right_panel.fill((0, 0, 0, 0))
+                self._render_frames(data["lines"])
+            finally:
+                self.right_panel.unlock()
+                self.left_panel.unlock()
+
+            # Draw Hold area
+            self._render_hold_area(hold_tetromino, data["can_hold"])
+
+            # Draw Next area
+            self._render_next_area(data["next_tetrominos"])
+
+            # Draw Score area
+            self._render_score_area(data["score"], data["level"], data["lines"])
+
+        # Draw side panels and stat values on main screen
+        self.screen.blit(self.left_panel, self.left_panel_pos)
+        self.screen.blit(self.right_panel, self.right_panel_pos)
+        self.screen.blits(self._stat_blits, doreturn=False)
 
         # Show FPS if enabled
         if self.config["ui"]["show_fps"]:
             fps = int(1.0 / max(0.001, pygame.time.Clock().get_time() / 1000))
             fps_text = self.small_font.render(f"FPS: {fps}", True, WHITE)
-            self.hud_surface.blit(fps_text, (10, 10))
+            self.screen.blit(fps_text, (10, 10))
 
         # Show player name and time
         self._render_player_info(data["username"], data["time"])
 
-        # Draw HUD on main screen
-        self.screen.blit(self.hud_surface, (0, 0))
+    def _render_frames(self, lines):
+        """
+        Draw area frames and the level progress bar onto the side panels
+
+        Args:
+            lines (int): Number of lines cleared
+        """
+        for surface, area in (
+            (self.left_panel, self.hold_area),
+            (self.right_panel, self.next_area),
+            (self.left_panel, self.score_area),
+        ):
+            pygame.draw.rect(surface, (40, 40, 60), area)
+            pygame.draw.rect(surface, DENSO_RED, area, 2)
+
+        # Calculate progress
+        level_up_lines = self.config["game"]["level_up_lines"]
+        progress = (lines % level_up_lines) / level_up_lines
+
+        # Draw progress bar
+        bar_x, bar_y, bar_width, bar_height = self.progress_bar
+
+        # Border
+        pygame.draw.rect(self.left_panel, WHITE, self.progress_bar, 1)
+
+        # Progress
+        progress_width = int(bar_width * progress)
+        pygame.draw.rect(
+            self.left_panel, DENSO_RED, (bar_x, bar_y, progress_width, bar_height)
+        )
 
     def _render_hold_area(self, hold_tetromino, can_hold):
         """
@@ -135,54 +254,29 @@ class GameUI:
             can_hold (bool): Whether holding is available
         """
         area = self.hold_area
-
-        # Draw frame
-        pygame.draw.rect(
-            self.hud_surface,
-            (40, 40, 60),
-            (area["x"], area["y"], area["width"], area["height"]),
-        )
-        pygame.draw.rect(
-            self.hud_surface,
-            DENSO_RED,
-            (area["x"], area["y"], area["width"], area["height"]),
-            2,
-        )
+        x, y, width, height = area
+        surface = self.left_panel
 
         # Draw title
-        hold_text = self.medium_font.render("HOLD", True, WHITE)
-        hold_rect = hold_text.get_rect(
-            center=(area["x"] + area["width"] // 2, area["y"] - 20)
-        )
-        self.hud_surface.blit(hold_text, hold_rect)
+        surface.blit(self._labels["HOLD"], self._label_rects["HOLD"])
 
         # Draw held block
         if hold_tetromino:
             # Calculate block position (center of area)
             shape = hold_tetromino.shape[0]  # Use default rotation
-            width = max(x for x, y in shape) - min(x for x, y in shape) + 1
-            height = max(y for x, y in shape) - min(y for x, y in shape) + 1
+            shape_w = max(bx for bx, by in shape) - min(bx for bx, by in shape) + 1
+            shape_h = max(by for bx, by in shape) - min(by for bx, by in shape) + 1
 
-            cell_size = min(area["width"] / (width + 2), area["height"] / (height + 2))
+            cell_size = min(width // (shape_w + 2), height // (shape_h + 2))
 
             # Starting position
-            start_x = area["x"] + (area["width"] - width * cell_size) / 2
-            start_y = area["y"] + (area["height"] - height * cell_size) / 2
-
-            # Draw each cell of the block
-            for block_x, block_y in shape:
-                rect = pygame.Rect(
-                    start_x + block_x * cell_size,
-                    start_y + block_y * cell_size,
-                    cell_size,
-                    cell_size,
-                )
-
-                # If can't hold, show as gray
-                color = hold_tetromino.color if can_hold else GRAY
+            start_x = x + (width - shape_w * cell_size) // 2
+            start_y = y + (height - shape_h * cell_size) // 2
 
-                pygame.draw.rect(self.hud_surface, color, rect)
-                pygame.draw.rect(self.hud_surface, WHITE, rect, 1)
+            # Draw the pre-composed block (gray variant if can't hold)
+            color = hold_tetromino.color if can_hold else GRAY
+            sprite = self._get_piece_sprite(hold_tetromino, color, cell_size)
+            surface.blit(sprite, (start_x, start_y))
 
     def _render_next_area(self, next_tetrominos):
         """
@@ -192,26 +286,11 @@ class GameUI:
             next_tetrominos (list): List of next tetrominos
         """
         area = self.next_area
-
-        # Draw frame
-        pygame.draw.rect(
-            self.hud_surface,
-            (40, 40, 60),
-            (area["x"], area["y"], area["width"], area["height"]),
-        )
-        pygame.draw.rect(
-            self.hud_surface,
-            DENSO_RED,
-            (area["x"], area["y"], area["width"], area["height"]),
-            2,
-        )
+        x, y, width, height = area
+        surface = self.right_panel
 
         # Draw title
-        next_text = self.medium_font.render("NEXT", True, WHITE)
-        next_rect = next_text.get_rect(
-            center=(area["x"] + area["width"] // 2, area["y"] - 20)
-        )
-        self.hud_surface.blit(next_text, next_rect)
+        surface.blit(self._labels["NEXT"], self._label_rects["NEXT"])
 
         # Draw next blocks
         preview_count = min(
@@ -223,26 +302,67 @@ class GameUI:
 
             # Calculate block position
             shape = tetromino.shape[0]  # Use default rotation
-            width = max(x for x, y in shape) - min(x for x, y in shape) + 1
-            height = max(y for x, y in shape) - min(y for x, y in shape) + 1
+            shape_w = max(bx for bx, by in shape) - min(bx for bx, by in shape) + 1
 
-            cell_size = min(area["width"] / (width + 2), 50)
+            cell_size = min(width // (shape_w + 2), 50)
 
             # Starting position
-            start_x = area["x"] + (area["width"] - width * cell_size) / 2
-            start_y = area["y"] + 20 + i * 60
+            start_x = x + (width - shape_w * cell_size) // 2
+            start_y = y + 20 + i * 60
+
+            # Draw the pre-composed block
+            sprite = self._get_piece_sprite(tetromino, tetromino.color, cell_size)
+            surface.blit(sprite, (start_x, start_y))
+
+    def _get_piece_sprite(self, tetromino, color, cell_size):
+        """
+        Get a pre-rendered surface of a tetromino in its default rotation
+
+        Sprites are built once per (shape, color, cell size), so the per-cell
+        position math only runs the first time a piece type is shown.
+
+        Args:
+            tetromino (Tetromino): Block to draw
+            color (tuple): Cell color
+            cell_size (int): Size of one cell in pixels
+
+        Returns:
+            pygame.Surface: Block sprite with cell borders baked in
+        """
+        key = (tetromino.shape_name, color, cell_size)
+        sprite = self._piece_sprites.get(key)
+        if sprite is None:
+            shape = tetromino.shape[0]  # Use default rotation
+            shape_w = max(bx for bx, by in shape) + 1
+            shape_h = max(by for bx, by in shape) + 1
+            sprite = pygame.Surface(
+                (shape_w * cell_size, shape_h * cell_size), pygame.SRCALPHA
+            ).convert_alpha()
 
             # Draw each cell of the block
             for block_x, block_y in shape:
                 rect = pygame.Rect(
-                    start_x + block_x * cell_size,
-                    start_y + block_y * cell_size,
-                    cell_size,
-                    cell_size,
+                    block_x * cell_size, block_y * cell_size, cell_size, cell_size
                 )
+                self._draw_cell(sprite, color, rect)
+
+            self._piece_sprites[key] = sprite
+        return sprite
+
+    def _draw_cell(self, surface, color, rect):
+        """
+        Draw a single block cell with a 1px white border
+
+        Uses two Surface.fill calls (border, then inset body) instead of a
+        filled plus an outlined pygame.draw.rect.
 
-                pygame.draw.rect(self.hud_surface, tetromino.color, rect)
-                pygame.draw.rect(self.hud_surface, WHITE, rect, 1)
+        Args:
+            surface (pygame.Surface): Target surface
+            color (tuple): Cell color
+            rect (pygame.Rect): Cell rectangle
+        """
+        surface.fill(WHITE, rect)
+        surface.fill(color, rect.inflate(-2, -2))
 
     def _render_score_area(self, score, level, lines):
         """
@@ -254,80 +374,47 @@ class GameUI:
             lines (int): Number of lines cleared
         """
         area = self.score_area
+        x, y, width, height = area
+        surface = self.left_panel
 
-        # Draw frame
-        pygame.draw.rect(
-            self.hud_surface,
-            (40, 40, 60),
-            (area["x"], area["y"], area["width"], area["height"]),
-        )
-        pygame.draw.rect(
-            self.hud_surface,
-            DENSO_RED,
-            (area["x"], area["y"], area["width"], area["height"]),
-            2,
-        )
+        # Values go straight to the screen, so offset them by the panel
+        value_x = self.left_panel_pos[0] + x + 10
+        value_y = self.left_panel_pos[1] + y + 45
 
         # Draw title
-        score_text = self.medium_font.render("STATS", True, WHITE)
-        score_rect = score_text.get_rect(
-            center=(area["x"] + area["width"] // 2, area["y"] - 20)
-        )
-        self.hud_surface.blit(score_text, score_rect)
+        surface.blit(self._labels["STATS"], self._label_rects["STATS"])
 
         # Draw score
-        y_pos = area["y"] + 20
+        y_pos = y + 20
 
-        score_label = self.small_font.render("Score:", True, WHITE)
-        self.hud_surface.blit(score_label, (area["x"] + 10, y_pos))
+        surface.blit(self._labels["Score:"], self._label_rects["Score:"])
 
         score_value = self.medium_font.render(f"{score:,}", True, (255, 255, 0))
-        self.hud_surface.blit(score_value, (area["x"] + 10, y_pos + 25))
 
         # Draw level
         y_pos += 70
 
-        level_label = self.small_font.render("Level:", True, WHITE)
-        self.hud_surface.blit(level_label, (area["x"] + 10, y_pos))
+        surface.blit(self._labels["Level:"], self._label_rects["Level:"])
 
         level_value = self.medium_font.render(f"{level}", True, (0, 255, 255))
-        self.hud_surface.blit(level_value, (area["x"] + 10, y_pos + 25))
 
         # Draw lines cleared
         y_pos += 70
 
-        lines_label = self.small_font.render("Lines:", True, WHITE)
-        self.hud_surface.blit(lines_label, (area["x"] + 10, y_pos))
+        surface.blit(self._labels["Lines:"], self._label_rects["Lines:"])
 
         lines_value = self.medium_font.render(f"{lines}", True, (0, 255, 0))
-        self.hud_surface.blit(lines_value, (area["x"] + 10, y_pos + 25))
+
+        self._stat_blits = [
+            (score_value, (value_x, value_y)),
+            (level_value, (value_x, value_y + 70)),
+            (lines_value, (value_x, value_y + 140)),
+        ]
 
         # Draw level progress bar
         y_pos += 70
 
-        progress_label = self.small_font.render("Next Level:", True, WHITE)
-        self.hud_surface.blit(progress_label, (area["x"] + 10, y_pos))
-
-        # Calculate progress
-        level_up_lines = self.config["game"]["level_up_lines"]
-        progress = (lines % level_up_lines) / level_up_lines
-
-        # Draw progress bar
-        bar_width = area["width"] - 20
-        bar_height = 15
-        bar_x = area["x"] + 10
-        bar_y = y_pos + 25
-
-        # Border
-        pygame.draw.rect(
-            self.hud_surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1
-        )
-
-        # Progress
-        progress_width = bar_width * progress
-        pygame.draw.rect(
-            self.hud_surface, DENSO_RED, (bar_x, bar_y, progress_width, bar_height)
-        )
+        surface.blit(self._labels["Next Level:"], self._label_rects["Next Level:"])
 
     def _render_player_info(self, username, game_time):
         """
@@ -337,25 +424,31 @@ class GameUI:
             username (str): Player name
             game_time (float): Play time (seconds)
         """
-        # Draw player name
-        player_text = self.small_font.render(f"Player: {username}", True, WHITE)
-        self.hud_surface.blit(player_text, (10, SCREEN_HEIGHT - 30))
+        # Draw player name (re-rendered only when the name changes)
+        if username != self._last_username:
+            self._last_username = username
+            self._player_text = self.small_font.render(
+                f"Player: {username}", True, WHITE
+            )
+        self.screen.blit(self._player_text, (10, SCREEN_HEIGHT - 30))
+
+        # Re-render time only when the displayed second advances
+        total_seconds = int(game_time)
+        if total_seconds != self._last_seconds:
+            self._last_seconds = total_seconds
 
-        # Convert time to mm:ss format
-        minutes = int(game_time) // 60
-        seconds = int(game_time) % 60
-        time_str = f"{minutes:02d}:{seconds:02d}"
+            # Convert time to mm:ss format
+            minutes = total_seconds // 60
+            seconds = total_seconds % 60
+            time_str = f"{minutes:02d}:{seconds:02d}"
+
+            self._time_text = self.small_font.render(f"Time: {time_str}", True, WHITE)
+            self._time_rect = self._time_text.get_rect(
+                topright=(SCREEN_WIDTH - 10, 10)
+            )
 
         # Draw time
-        time_text = self.small_font.render(f"Time: {time_str}", True, WHITE)
-        time_rect = time_text.get_rect(topright=(SCREEN_WIDTH - 10, 10))
-        self.hud_surface.blit(time_text, time_rect)
+        self.screen.blit(self._time_text, self._time_rect)
 
         # Draw copyright
-        copyright_text = self.small_font.render(
-            "© 2025 Thammaphon Chittasuwanna (SDM)", True, (150, 150, 150)
-        )
-        copyright_rect = copyright_text.get_rect(
-            midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 5)
-        )
-        self.hud_surface.blit(copyright_text, copyright_rect)
+        self.screen.blit(self._labels["copyright"], self._label_rects["copyright"])
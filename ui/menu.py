@@ -8,14 +8,20 @@ Classes for main menu and submenus with modern design
 """
 
 # Standard library imports
+import io
 import os
 import sys
 import math
 import time
 import random
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
 
+import numpy as np
+
 try:
     import pygame
 except ImportError:
@@ -29,6 +35,7 @@ except ImportError:
 
 from pygame.locals import (
     KEYDOWN,
+    KEYUP,
     MOUSEBUTTONDOWN,
     QUIT,
     MOUSEMOTION,
@@ -105,7 +112,6 @@ try:
         get_top_scores,
         authenticate_user,
         register_user,
-        get_user_settings,
     )
 
     DB_AVAILABLE = True
@@ -116,6 +122,149 @@ except ImportError:
 # Setup logger
 logger = logging.getLogger("tetris.menu")
 
+# Button look (bg, hover, border) for the keyboard-selected main menu item
+SELECTED_BUTTON_COLORS = (DENSO_RED, DENSO_LIGHT_RED, WHITE)
+
+# Color that never appears in menu art, used to key out template corners
+TEMPLATE_COLORKEY = (255, 0, 255)
+
+# Number of rows the leaderboard table is laid out for
+LEADERBOARD_ROWS = 10
+
+# Seconds a loaded leaderboard is reused before the database is asked again
+LEADERBOARD_CACHE_SECONDS = 30
+
+# Posted by the leaderboard worker thread with either `rows` or `error`
+LEADERBOARD_LOADED = pygame.event.custom_type()
+
+# Posted by the login/register worker thread with `action`, `username` and
+# either `ok` or `error`
+AUTH_DONE = pygame.event.custom_type()
+
+# Held by the menu's worker threads around database calls. The in-memory
+# SQLite fallback has a single shared connection, so they must not overlap.
+_DB_LOCK = threading.Lock()
+
+# Cell size in pixels of the background tetromino sprites (before scaling)
+BG_TETROMINO_CELL = 20
+
+# Glow color ramp around the animated separator line, fading out with distance
+LINE_GLOW_COLORS = tuple((*DENSO_RED, max(0, 100 - i * 20)) for i in range(5))
+
+# Border and message color of an input field in the error state
+INPUT_ERROR_COLOR = (200, 50, 50)
+
+# Leaderboard rank labels and colors for the top 3 places
+RANK_MEDALS = (
+    ("🥇 1", (255, 215, 0)),  # Gold
+    ("🥈 2", (192, 192, 192)),  # Silver
+    ("🥉 3", (205, 127, 50)),  # Bronze
+)
+
+# Additive copies of the title text that make up its glow
+TITLE_GLOW_SPREAD = 3
+TITLE_GLOW_OFFSETS = tuple(
+    offset
+    for i in range(1, TITLE_GLOW_SPREAD + 1)
+    for offset in ((i, 0), (-i, 0), (0, i), (0, -i))
+)
+
+
+# Sine lookup table for the input field shake (size must be a power of two)
+SIN_LUT_SIZE = 256
+SIN_LUT_SCALE = SIN_LUT_SIZE / math.tau
+_SIN_LUT = tuple(math.sin(i * math.tau / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE))
+
+
+# Rendered widget text shared by all buttons and input fields, see _render_cached
+TEXT_CACHE_SIZE = 512
+_TEXT_CACHE = OrderedDict()
+
+
+def _render_cached(font, text, color):
+    """
+    Render antialiased text through a shared LRU cache
+
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: Text color
+
+    Returns:
+        pygame.Surface: Rendered text (shared, do not draw onto it)
+    """
+    key = (font, text, color)
+    text_surf = _TEXT_CACHE.get(key)
+    if text_surf is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return text_surf
+
+    text_surf = font.render(text, True, color).convert_alpha()
+    _TEXT_CACHE[key] = text_surf
+    if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+    return text_surf
+
+
+# Decoded (and scaled) icon images shared by all widgets, see _load_icon
+_ICON_CACHE = {}
+
+
+def _load_icon(path, size=None):
+    """
+    Load an icon image once and share it between widgets
+
+    Args:
+        path: Image file path
+        size: Optional (width, height) to scale the icon to
+
+    Returns:
+        pygame.Surface: Icon (shared, do not draw onto it), or None if the
+            file does not exist
+    """
+    key = (path, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        if size is None:
+            if not os.path.exists(path):
+                return None
+            icon = pygame.image.load(path).convert_alpha()
+        else:
+            icon = _load_icon(path)
+            if icon is None:
+                return None
+            icon = pygame.transform.scale(icon, size)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+@lru_cache(maxsize=512)
+def _fmt_score(score):
+    """Format a score with thousands separators (memoized per value)"""
+    return f"{score:,}"
+
+
+class _BgTetromino:
+    """
+    Look of one animated background tetromino
+
+    Its motion (position, rotation and speeds) is kept in the MainMenu._bg_*
+    arrays so all pieces can be moved at once.
+    """
+
+    __slots__ = ("sprite_idx", "scale", "alpha")
+
+    def __init__(self, sprite_idx):
+        """
+        Create a background tetromino with a random size and opacity
+
+        Args:
+            sprite_idx: Index into MainMenu._tetromino_sprites
+        """
+        self.sprite_idx = sprite_idx
+        self.scale = random.uniform(0.5, 1.5)
+        self.alpha = random.randint(30, 100)
+
 
 class Button:
     """Class for interactive buttons with modern design"""
@@ -165,16 +314,19 @@ class Button:
         self.icon_rect = None
 
         # Load icon if provided
-        if icon and os.path.exists(icon):
+        if icon:
             try:
-                self.icon = pygame.image.load(icon)
-                self.icon = pygame.transform.scale(
-                    self.icon, (height - 10, height - 10)
-                )
-                self.icon_rect = self.icon.get_rect(midleft=(x + 10, y + height // 2))
+                self.icon = _load_icon(icon, (height - 10, height - 10))
+                if self.icon:
+                    self.icon_rect = self.icon.get_rect(
+                        midleft=(x + 10, y + height // 2)
+                    )
             except Exception as e:
                 logger.error(f"Couldn't load icon {icon}: {e}")
 
+        # Pre-rendered button looks, keyed by color scheme
+        self._state_cache = {}
+
         # Pre-render text
         self.update_text(text)
 
@@ -185,7 +337,8 @@ class Button:
     def update_text(self, text):
         """Update button text"""
         self.text = text
-        self.text_surf = self.font.render(self.text, True, self.text_color)
+        self.text_surf = _render_cached(self.font, self.text, self.text_color)
+        self._state_cache.clear()
 
         # Adjust text position based on icon presence
         if self.icon:
@@ -195,20 +348,27 @@ class Button:
 
         self.text_rect = self.text_surf.get_rect(center=(text_x, self.rect.centery))
 
-    def update(self, events, dt=1 / 60):
+    def update(self, click_events, mouse_pos=None, dt=1 / 60, hovered=None):
         """
         Update button state based on events
 
         Args:
-            events: List of pygame events
+            click_events: Left-button MOUSEBUTTONDOWN events, already
+                filtered by the caller
+            mouse_pos: Mouse position sampled once per frame by the caller,
+                queried from pygame if not given
             dt: Delta time for animations
+            hovered: Whether the cursor is over the button, if the caller
+                already hit-tested it
 
         Returns:
             bool: True if button was clicked
         """
-        mouse_pos = pygame.mouse.get_pos()
-        was_hovered = self.hovered
-        self.hovered = self.rect.collidepoint(mouse_pos)
+        if hovered is None:
+            if mouse_pos is None:
+                mouse_pos = pygame.mouse.get_pos()
+            hovered = self.rect.collidepoint(mouse_pos)
+        self.hovered = hovered
 
         # Update hover animation
         if self.hovered:
@@ -220,94 +380,134 @@ class Button:
                 0.0, self.animation_state - dt * self.animation_speed
             )
 
-        for event in events:
-            if event.type == MOUSEBUTTONDOWN and event.button == 1:
-                if self.hovered:
-                    self.clicked = True
-                    if self.action:
-                        self.action()
-                    return True
+        if click_events and self.hovered:
+            self.clicked = True
+            if self.action:
+                self.action()
+            return True
 
         return False
 
-    def draw(self, surface):
+    def _render_state(self, bg_color, border_color, hover_amount):
         """
-        Draw the button with modern effects
+        Render the full button appearance for one state onto a new surface
 
         Args:
-            surface: Surface to draw on
-        """
-        # Calculate animated colors
-        if self.animation_state > 0:
-            # Interpolate between normal and hover colors
-            r = int(
-                self.bg_color[0]
-                + (self.hover_color[0] - self.bg_color[0]) * self.animation_state
-            )
-            g = int(
-                self.bg_color[1]
-                + (self.hover_color[1] - self.bg_color[1]) * self.animation_state
-            )
-            b = int(
-                self.bg_color[2]
-                + (self.hover_color[2] - self.bg_color[2]) * self.animation_state
-            )
-            color = (r, g, b)
+            bg_color: Background color
+            border_color: Border color (None for no border)
+            hover_amount: 0 for the normal look, 1 for the hovered look
 
-            # Also animate text position for "press" effect
-            text_offset = int(2 * self.animation_state)
-            text_pos = (self.text_rect.x, self.text_rect.y + text_offset)
-        else:
-            color = self.bg_color
-            text_pos = (self.text_rect.x, self.text_rect.y)
+        Returns:
+            pygame.Surface: Button-sized per-pixel alpha surface
+        """
+        width, height = self.rect.size
+        local_rect = pygame.Rect(0, 0, width, height)
+        state_surf = pygame.Surface((width, height), pygame.SRCALPHA)
 
         # Draw button background with rounded corners
         if self.corner_radius > 0:
             pygame.draw.rect(
-                surface, color, self.rect, border_radius=self.corner_radius
+                state_surf, bg_color, local_rect, border_radius=self.corner_radius
             )
         else:
-            pygame.draw.rect(surface, color, self.rect)
+            pygame.draw.rect(state_surf, bg_color, local_rect)
 
         # Draw border if specified
-        if self.border_color:
-            border_color = self.border_color
-            if self.hovered:
-                # Brighter border on hover
-                border_color = (
-                    min(255, border_color[0] + 50),
-                    min(255, border_color[1] + 50),
-                    min(255, border_color[2] + 50),
-                )
-
+        if border_color:
             pygame.draw.rect(
-                surface,
+                state_surf,
                 border_color,
-                self.rect,
+                local_rect,
                 width=2,
                 border_radius=self.corner_radius,
             )
 
         # Draw icon if available
         if self.icon:
-            surface.blit(self.icon, self.icon_rect)
+            state_surf.blit(
+                self.icon, self.icon.get_rect(midleft=(10, height // 2))
+            )
+
+        # Draw text (shifted down on hover for a "press" effect)
+        text_x = width // 2 + 15 if self.icon else width // 2
+        text_rect = self.text_surf.get_rect(
+            center=(text_x, height // 2 + 2 * hover_amount)
+        )
+        state_surf.blit(self.text_surf, text_rect)
 
-        # Draw text
-        surface.blit(self.text_surf, text_pos)
+        # Draw subtle glow effect when hovered. BLEND_RGB_ADD leaves alpha
+        # untouched, so filling in place only tints the visible button shape.
+        if hover_amount:
+            state_surf.fill(DENSO_RED, special_flags=pygame.BLEND_RGB_ADD)
 
-        # Draw subtle glow effect when hovered
-        if self.animation_state > 0:
-            glow_surf = pygame.Surface(
-                (self.rect.width, self.rect.height), pygame.SRCALPHA
-            )
-            glow_color = (*DENSO_RED, int(50 * self.animation_state))
-            pygame.draw.rect(
-                glow_surf,
-                glow_color,
-                (0, 0, self.rect.width, self.rect.height),
-                border_radius=self.corner_radius,
+        return state_surf.convert_alpha()
+
+    def _get_state_surfaces(self, colors):
+        """
+        Get the pre-rendered normal and hovered surfaces for a color scheme
+
+        Surfaces are cached per color scheme, so drawing a button with
+        override colors (e.g. to show keyboard selection) renders it once.
+
+        Args:
+            colors: (bg_color, hover_color, border_color) tuple
+
+        Returns:
+            tuple: (normal_surface, hover_surface)
+        """
+        surfaces = self._state_cache.get(colors)
+        if surfaces is None:
+            bg_color, hover_color, border_color = colors
+            hover_border = None
+            if border_color:
+                # Brighter border on hover
+                hover_border = (
+                    min(255, border_color[0] + 50),
+                    min(255, border_color[1] + 50),
+                    min(255, border_color[2] + 50),
+                )
+            surfaces = (
+                self._render_state(bg_color, border_color, 0),
+                self._render_state(hover_color, hover_border, 1),
             )
-            surface.blit(glow_surf, self.rect, special_flags=pygame.BLEND_RGB_ADD)
+            self._state_cache[colors] = surfaces
+        return surfaces
+
+    def get_blits(self, colors=None):
+        """
+        Get the blit sequence that draws this button in its current state
+
+        While the hover animation is in progress the hovered look is faded
+        in over the normal one.
+
+        Args:
+            colors: Optional (bg_color, hover_color, border_color) override,
+                defaults to the button's own colors
+
+        Returns:
+            list: (surface, position) pairs for Surface.blits
+        """
+        if colors is None:
+            colors = (self.bg_color, self.hover_color, self.border_color)
+        normal_surf, hover_surf = self._get_state_surfaces(colors)
+        pos = self.rect.topleft
+
+        if self.animation_state <= 0:
+            return [(normal_surf, pos)]
+
+        hover_surf.set_alpha(int(255 * self.animation_state))
+        if self.animation_state >= 1:
+            return [(hover_surf, pos)]
+        return [(normal_surf, pos), (hover_surf, pos)]
+
+    def draw(self, surface):
+        """
+        Draw the button with modern effects
+
+        Args:
+            surface: Surface to draw on
+        """
+        surface.blits(self.get_blits(), doreturn=False)
 
 
 class InputField:
@@ -358,9 +558,10 @@ class InputField:
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
-        self.last_key_time = 0
         self.key_repeat_delay = 500  # ms before key starts repeating
         self.key_repeat_interval = 50  # ms between repeats
+        self._backspace_held = False
+        self._backspace_repeat_at = 0  # ms timestamp of the next repeat
         self.input_type = input_type
         self.error_message = ""
         self.valid = True
@@ -369,13 +570,13 @@ class InputField:
         self.helper_text = ""
 
         # Load icon if provided
-        if icon and os.path.exists(icon):
+        if icon:
             try:
-                self.icon = pygame.image.load(icon)
-                self.icon = pygame.transform.scale(
-                    self.icon, (height - 10, height - 10)
-                )
-                self.icon_rect = self.icon.get_rect(midleft=(x + 10, y + height // 2))
+                self.icon = _load_icon(icon, (height - 10, height - 10))
+                if self.icon:
+                    self.icon_rect = self.icon.get_rect(
+                        midleft=(x + 10, y + height // 2)
+                    )
             except Exception as e:
                 logger.error(f"Couldn't load icon {icon}: {e}")
 
@@ -390,6 +591,44 @@ class InputField:
         self.padding = 10
         self.icon_padding = 35 if self.icon else 0
 
+        # Cached text surfaces (text is re-rendered only when it changes)
+        self._placeholder_surf = _render_cached(
+            self.font, self.placeholder, (100, 100, 110)
+        )
+        self._rendered_text = None
+        self._text_surf = None
+        self._rendered_message = None  # (text, color) of the message below
+        self._message_surf = None
+
+        # Pre-rendered field backgrounds for each border state
+        self._bg_idle = self._render_background(self.border_color)
+        self._bg_active = self._render_background(self.active_border_color)
+        self._bg_error = self._render_background(INPUT_ERROR_COLOR)
+
+    def _render_background(self, border_color):
+        """
+        Render the rounded field background with a border
+
+        Args:
+            border_color: Border color
+
+        Returns:
+            pygame.Surface: Field-sized per-pixel alpha surface
+        """
+        bg_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = bg_surf.get_rect()
+
+        # Draw with rounded corners
+        pygame.draw.rect(
+            bg_surf, self.bg_color, local_rect, border_radius=self.corner_radius
+        )
+
+        # Draw border
+        pygame.draw.rect(
+            bg_surf, border_color, local_rect, width=2, border_radius=self.corner_radius
+        )
+        return bg_surf.convert_alpha()
+
     def handle_event(self, event):
         """
         Handle input events
@@ -405,16 +644,20 @@ class InputField:
             self.active = self.rect.collidepoint(event.pos)
             return self.active
 
+        if event.type == KEYUP and event.key == K_BACKSPACE:
+            self._backspace_held = False
+
         if not self.active:
             return False
 
         if event.type == KEYDOWN:
-            current_time = pygame.time.get_ticks()
-
             # Handle different key inputs
             if event.key == K_BACKSPACE:
+                self._backspace_held = True
+                self._backspace_repeat_at = (
+                    pygame.time.get_ticks() + self.key_repeat_delay
+                )
                 self.text = self.text[:-1]
-                self.last_key_time = current_time
                 self._validate()
                 return True
 
@@ -430,7 +673,6 @@ class InputField:
                 # Only accept printable characters
                 if ord(event.unicode) >= 32:
                     self.text += event.unicode
-                    self.last_key_time = current_time
                     self._validate()
                     return True
 
@@ -463,20 +705,24 @@ class InputField:
         Args:
             dt: Time delta in seconds
         """
-        # Blink cursor
-        self.cursor_timer += dt * 1000  # Convert to ms
-        if self.cursor_timer >= 500:  # Blink every 500ms
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
+        # An inactive field with no fade-out or shake left has nothing to do
+        if not self.active and self.animation_state <= 0 and self.shake_time <= 0:
+            return
 
-        # Handle key repeats for backspace
-        if pygame.key.get_pressed()[K_BACKSPACE] and self.active:
+        if self.active:
+            # Blink cursor
+            self.cursor_timer += dt * 1000  # Convert to ms
+            if self.cursor_timer >= 500:  # Blink every 500ms
+                self.cursor_visible = not self.cursor_visible
+                self.cursor_timer = 0
+
+        # Handle key repeats for backspace (held state comes from
+        # KEYDOWN/KEYUP, so the keyboard is never polled)
+        if self.active and self._backspace_held:
             current_time = pygame.time.get_ticks()
-            if (
-                current_time - self.last_key_time > self.key_repeat_delay
-                and current_time % self.key_repeat_interval < 20
-            ):
+            if current_time >= self._backspace_repeat_at:
                 self.text = self.text[:-1]
+                self._backspace_repeat_at = current_time + self.key_repeat_interval
                 self._validate()
 
         # Update hover/active animation
@@ -492,7 +738,8 @@ class InputField:
         # Update shake animation if active
         if self.shake_time > 0:
             self.shake_time -= dt
-            self.shake_offset = math.sin(self.shake_time * 30) * (
+            phase = int(self.shake_time * 30 * SIN_LUT_SCALE) & (SIN_LUT_SIZE - 1)
+            self.shake_offset = _SIN_LUT[phase] * (
                 8 * self.shake_time / self.shake_duration
             )
             if self.shake_time <= 0:
@@ -521,61 +768,50 @@ class InputField:
         rect = self.rect.copy()
         rect.x += x_offset
 
-        # Draw field background
-        border_color = self.border_color
-
-        # Determine border color based on state
+        # Draw the pre-rendered field background for the current state
         if not self.valid and self.error_message:
             # Error state
-            border_color = (200, 50, 50)  # Error red
+            surface.blit(self._bg_error, rect)
+        elif self.active and self.animation_state < 1:
+            # Active state fading in: cross-fade the border colors
+            surface.blit(self._bg_idle, rect)
+            self._bg_active.set_alpha(int(255 * self.animation_state))
+            surface.blit(self._bg_active, rect)
         elif self.active:
-            # Active state
-            r = int(
-                self.border_color[0]
-                + (self.active_border_color[0] - self.border_color[0])
-                * self.animation_state
-            )
-            g = int(
-                self.border_color[1]
-                + (self.active_border_color[1] - self.border_color[1])
-                * self.animation_state
-            )
-            b = int(
-                self.border_color[2]
-                + (self.active_border_color[2] - self.border_color[2])
-                * self.animation_state
+            self._bg_active.set_alpha(255)
+            surface.blit(self._bg_active, rect)
+        else:
+            surface.blit(self._bg_idle, rect)
+
+        # Icon (if available) and text are drawn in one batch
+        field_blits = []
+        if self.icon:
+            field_blits.append(
+                (self.icon, (self.icon_rect.x + x_offset, self.icon_rect.y))
             )
-            border_color = (r, g, b)
 
-        # Draw with rounded corners
-        pygame.draw.rect(surface, self.bg_color, rect, border_radius=self.corner_radius)
+        # Render text or placeholder (only when the text has changed)
+        if self.text != self._rendered_text:
+            self._rendered_text = self.text
 
-        # Draw border
-        pygame.draw.rect(
-            surface, border_color, rect, width=2, border_radius=self.corner_radius
-        )
+            # Prepare text to display
+            display_text = self.text
+            if self.input_type == "password":
+                display_text = "•" * len(self.text)
 
-        # Draw icon if available
-        if self.icon:
-            icon_rect = self.icon_rect.copy()
-            icon_rect.x += x_offset
-            surface.blit(self.icon, icon_rect)
-
-        # Prepare text to display
-        display_text = self.text
-        if self.input_type == "password":
-            display_text = "•" * len(self.text)
-
-        # Render text or placeholder
-        if display_text:
-            text_surf = self.font.render(display_text, True, self.text_color)
-        else:
-            text_surf = self.font.render(self.placeholder, True, (100, 100, 110))
+            if display_text:
+                self._text_surf = _render_cached(
+                    self.font, display_text, self.text_color
+                )
+            else:
+                self._text_surf = self._placeholder_surf
+        text_surf = self._text_surf
 
         # Calculate text position (left-aligned with padding)
         text_x = rect.x + self.padding + self.icon_padding
         text_y = rect.centery - text_surf.get_height() // 2
-        surface.blit(text_surf, (text_x, text_y))
+        field_blits.append((text_surf, (text_x, text_y)))
+        surface.blits(field_blits, doreturn=False)
 
         # Draw cursor when field is active
         if self.active and self.cursor_visible:
@@ -593,15 +829,21 @@ class InputField:
                 2,
             )
 
-        # Draw helper text or error message below the input field
+        # Draw helper text or error message below the input field (looked
+        # up only when the message changes)
         if self.error_message and not self.valid:
-            error_text = self.font.render(self.error_message, True, (200, 50, 50))
-            error_rect = error_text.get_rect(x=rect.x, y=rect.bottom + 5)
-            surface.blit(error_text, error_rect)
+            message = (self.error_message, INPUT_ERROR_COLOR)
         elif self.helper_text:
-            helper_text = self.font.render(self.helper_text, True, (150, 150, 150))
-            helper_rect = helper_text.get_rect(x=rect.x, y=rect.bottom + 5)
-            surface.blit(helper_text, helper_rect)
+            message = (self.helper_text, (150, 150, 150))
+        else:
+            message = None
+        if message != self._rendered_message:
+            self._rendered_message = message
+            self._message_surf = (
+                _render_cached(self.font, *message) if message else None
+            )
+        if self._message_surf:
+            surface.blit(self._message_surf, (rect.x, rect.bottom + 5))
 
 
 class MainMenu:
@@ -647,22 +889,17 @@ class MainMenu:
         # Load fonts
         pygame.font.init()
         try:
-            self.title_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', FONT_SIZE_TITLE
-            )
-            self.large_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', FONT_SIZE_LARGE
-            )
+            # Read the font file once; each size gets its own stream over
+            # the same bytes
+            font_data = Path(f'assets/fonts/{config["ui"]["font"]}.ttf').read_bytes()
+            self.title_font = pygame.font.Font(io.BytesIO(font_data), FONT_SIZE_TITLE)
+            self.large_font = pygame.font.Font(io.BytesIO(font_data), FONT_SIZE_LARGE)
             self.medium_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', FONT_SIZE_MEDIUM
-            )
-            self.small_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', FONT_SIZE_SMALL
+                io.BytesIO(font_data), FONT_SIZE_MEDIUM
             )
-            self.tiny_font = pygame.font.Font(
-                f'assets/fonts/{config["ui"]["font"]}.ttf', FONT_SIZE_TINY
-            )
-        except:
+            self.small_font = pygame.font.Font(io.BytesIO(font_data), FONT_SIZE_SMALL)
+            self.tiny_font = pygame.font.Font(io.BytesIO(font_data), FONT_SIZE_TINY)
+        except (pygame.error, OSError, KeyError):
             # Use system fonts if loading fails
             self.title_font = pygame.font.SysFont("Arial", FONT_SIZE_TITLE)
             self.large_font = pygame.font.SysFont("Arial", FONT_SIZE_LARGE)
@@ -670,6 +907,22 @@ class MainMenu:
             self.small_font = pygame.font.SysFont("Arial", FONT_SIZE_SMALL)
             self.tiny_font = pygame.font.SysFont("Arial", FONT_SIZE_TINY)
 
+        # Pre-render the title and its glow (only the glow alpha changes
+        # per frame)
+        self._title_denso = self.title_font.render(
+            "DENSO", True, DENSO_RED
+        ).convert_alpha()
+        self._title_tetris = self.title_font.render(
+            " TETRIS", True, WHITE
+        ).convert_alpha()
+        self._title_glow = self._create_title_glow()
+
+        # Glow position relative to the "DENSO" text (centered over it)
+        self._title_glow_offset = (
+            self._title_denso.get_width() // 2 - self._title_glow.get_width() // 2,
+            self._title_denso.get_height() // 2 - self._title_glow.get_height() // 2,
+        )
+
         # Menu items
         self.menu_items = [
             "Play Game",
@@ -681,6 +934,36 @@ class MainMenu:
         self.selected_item = 0
         self.username = "Guest"  # Default player name
 
+        # Separator line glows by line width, see _get_line_glow
+        self._line_glows = {}
+
+        # Rendered static menu text, see _get_text and _place_text
+        self._text_cache = {}
+        self._placed_text = {}
+
+        # Settings rows, rebuilt when the settings screen is opened
+        self._settings_dirty = True
+        self._settings_blits = []
+        self._settings_back_y = 0
+
+        # Static footer text shared by every menu
+        version_text = self.tiny_font.render("Version 1.0", True, UI_SUBTEXT)
+        self._version_surf = version_text.convert_alpha()
+        self._version_pos = version_text.get_rect(
+            bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 40)
+        ).topleft
+        copyright_text = self.tiny_font.render(
+            "© 2025 Thammaphon Chittasuwanna (SDM)", True, UI_SUBTEXT
+        )
+        self._copyright_surf = copyright_text.convert_alpha()
+        self._copyright_pos = copyright_text.get_rect(
+            midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20)
+        ).topleft
+
+        # Footer blits, rebuilt only when the player name changes
+        self._footer_username = None
+        self._footer_blits = []
+
         # Animation effects
         self.animation_timer = 0
         self.animation_speed = 0.5  # cycles per second
@@ -689,8 +972,12 @@ class MainMenu:
         self.transition_speed = 4.0  # Transition speed multiplier
         self.transition_direction = 1  # 1 for in, -1 for out
         self.transition_callback = None  # Callback after transition
+        self._transition_surface = pygame.Surface(
+            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        )
 
         # States
+        self.should_quit = False  # Set when "Exit" is chosen, read by main.py
         self.current_menu = "main"  # main, play, howto, settings, leaderboard, register
         self.login_message = ""
         self.register_message = ""
@@ -699,6 +986,33 @@ class MainMenu:
             "color": (255, 255, 255),
             "timer": 0,
             "duration": 3.0,  # seconds
+            "surface": None,  # Rendered box, see _show_notification
+        }
+
+        # Per-menu event handlers and renderers
+        self._event_dispatch = {
+            "main": self._handle_main_menu_event,
+            "play": self._handle_play_menu_event,
+            "register": self._handle_register_menu_event,
+            "howto": self._handle_howto_menu_event,
+            "settings": self._handle_settings_menu_event,
+            "leaderboard": self._handle_leaderboard_menu_event,
+        }
+        self._render_dispatch = {
+            "main": self._render_main_menu,
+            "play": self._render_play_menu,
+            "register": self._render_register_menu,
+            "howto": self._render_howto_menu,
+            "settings": self._render_settings_menu,
+            "leaderboard": self._render_leaderboard_menu,
+        }
+        # Main menu item actions, see _handle_menu_click
+        self._menu_actions = {
+            "Play Game": partial(self._set_transition, "play"),
+            "How to Play": partial(self._set_transition, "howto"),
+            "Settings": self._open_settings,
+            "Leaderboard": self._open_leaderboard,
+            "Exit": self._exit_game,
         }
 
         # Create buttons for main menu
@@ -727,16 +1041,10 @@ class MainMenu:
             icon="assets/images/icon_lock.png",
         )
 
-        self.email_input = InputField(
-            SCREEN_WIDTH // 2 - 150,
-            400,
-            300,
-            40,
-            placeholder="Email",
-            font=self.medium_font,
-            input_type="email",
-            icon="assets/images/icon_email.png",
-        )
+        # Register-only widgets are built on first use (see email_input and
+        # create_account_button)
+        self._email_input = None
+        self._create_account_button = None
 
         # Set helper text
         self.password_input.helper_text = "At least 6 characters"
@@ -778,7 +1086,7 @@ class MainMenu:
             50,
             "Play as Guest",
             self.medium_font,
-            action=lambda: self._set_transition("main", self._play_as_guest),
+            action=partial(self._set_transition, "main", self._play_as_guest),
             bg_color=(0, 120, 0),
             hover_color=(0, 150, 0),
             border_color=UI_BORDER,
@@ -797,30 +1105,88 @@ class MainMenu:
             border_color=UI_BORDER,
         )
 
-        self.create_account_button = Button(
-            SCREEN_WIDTH // 2 - 150,
-            530,
-            300,
-            50,
-            "Create Account",
-            self.medium_font,
-            action=self._handle_register,
-            bg_color=(0, 120, 120),
-            hover_color=(0, 150, 150),
-            border_color=UI_BORDER,
-        )
+        # Buttons shown on each menu (used for hover checks and animation)
+        self._buttons_by_menu = {
+            "main": self.main_menu_buttons,
+            "play": [
+                self.login_button,
+                self.register_button,
+                self.play_as_guest_button,
+                self.back_button,
+            ],
+            "register": [self.back_button],  # + create_account_button, lazily
+            "howto": [self.back_button],
+            "settings": [self.back_button],
+            "leaderboard": [self.back_button],
+        }
+        # Live Rect references, so buttons moved by a menu stay in sync
+        self._button_rects_by_menu = {
+            name: [button.rect for button in buttons]
+            for name, buttons in self._buttons_by_menu.items()
+        }
 
-        # Load high score player data
+        # Load high score player data (rows are laid out on first draw)
         self.leaderboard_data = []
+        self._lb_loaded_at = None  # time.monotonic() of the last successful load
+        self._lb_loading = False  # A worker is fetching scores
+        self._auth_pending = False  # A login/register worker is running
+        self._lb_blits = []
+        self._lb_dirty = True
+        self._lb_username = None
         self._load_leaderboard()
+        self._build_leaderboard_templates()
+
+        # Static How to Play card
+        self._build_howto_panel()
 
-        # Collect all input events
-        self.current_events = []
+        # Static layout of the other sub-menus
+        self._build_menu_chrome()
+
+        # Mouse position, sampled once per batch of events
+        self.mouse_pos = (0, 0)
+        self._mouse_moved = False
 
         # Tetromino animation for background
         self.bg_tetrominos = []
         self._init_bg_tetrominos()
 
+    @property
+    def email_input(self):
+        """InputField: Email field of the register screen, built on first use"""
+        if self._email_input is None:
+            self._email_input = InputField(
+                SCREEN_WIDTH // 2 - 150,
+                400,
+                300,
+                40,
+                placeholder="Email",
+                font=self.medium_font,
+                input_type="email",
+                icon="assets/images/icon_email.png",
+            )
+        return self._email_input
+
+    @property
+    def create_account_button(self):
+        """Button: Register screen submit button, built on first use"""
+        if self._create_account_button is None:
+            button = Button(
+                SCREEN_WIDTH // 2 - 150,
+                530,
+                300,
+                50,
+                "Create Account",
+                self.medium_font,
+                action=self._handle_register,
+                bg_color=(0, 120, 120),
+                hover_color=(0, 150, 150),
+                border_color=UI_BORDER,
+            )
+            self._create_account_button = button
+            self._buttons_by_menu["register"].insert(0, button)
+            self._button_rects_by_menu["register"].insert(0, button.rect)
+        return self._create_account_button
+
     def _load_assets(self):
         """Load additional assets for menu"""
         # Try to load icons
@@ -833,8 +1199,9 @@ class MainMenu:
 
         for name, path in icon_paths.items():
             try:
-                if os.path.exists(path):
-                    self.assets[name] = pygame.image.load(path)
+                icon = _load_icon(path)
+                if icon is not None:
+                    self.assets[name] = icon
                 else:
                     # Create directory if needed
                     os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -852,12 +1219,14 @@ class MainMenu:
                         icon = pygame.Surface((32, 32))
 
                     pygame.image.save(icon, path)
-                    self.assets[name] = icon
+                    self.assets[name] = icon.convert_alpha()
+                    _ICON_CACHE[(path, None)] = self.assets[name]
             except Exception as e:
                 self.logger.error(f"Could not load asset {name}: {e}")
                 # Create a backup surface
-                self.assets[name] = pygame.Surface((32, 32))
-                self.assets[name].fill(DENSO_RED)
+                backup = pygame.Surface((32, 32))
+                backup.fill(DENSO_RED)
+                self.assets[name] = backup.convert()
 
     def _create_user_icon(self):
         """Create a simple user icon"""
@@ -921,23 +1290,56 @@ class MainMenu:
             (235, 50, 50),  # Red (Z)
         ]
 
+        # Pre-render each shape once; pieces are rotated and scaled at draw
+        # time. Sprites are stored with their center in cell units so the
+        # rotated pieces keep following the same path.
+        self._tetromino_sprites = []
+        for shape, color in zip(tetromino_shapes, tetromino_colors):
+            cols = max(block_x for block_x, _ in shape) + 1
+            rows = max(block_y for _, block_y in shape) + 1
+            sprite = pygame.Surface(
+                (cols * BG_TETROMINO_CELL, rows * BG_TETROMINO_CELL), pygame.SRCALPHA
+            )
+            for block_x, block_y in shape:
+                rect = pygame.Rect(
+                    block_x * BG_TETROMINO_CELL,
+                    block_y * BG_TETROMINO_CELL,
+                    BG_TETROMINO_CELL,
+                    BG_TETROMINO_CELL,
+                )
+                pygame.draw.rect(sprite, color, rect, border_radius=2)
+                pygame.draw.rect(sprite, (*color, 128), rect, width=1, border_radius=2)
+            self._tetromino_sprites.append(
+                (sprite.convert_alpha(), (cols / 2, rows / 2))
+            )
+
         # Create 10 random tetrominos
-        for _ in range(10):
+        count = 10
+        for _ in range(count):
             shape_idx = random.randint(0, len(tetromino_shapes) - 1)
+            self.bg_tetrominos.append(_BgTetromino(shape_idx))
 
-            tetromino = {
-                "shape": tetromino_shapes[shape_idx],
-                "color": tetromino_colors[shape_idx],
-                "x": random.randint(-100, SCREEN_WIDTH - 50),
-                "y": random.randint(-200, -50),
-                "rotation": random.randint(0, 3),
-                "speed": random.uniform(15, 30),
-                "rotation_speed": random.uniform(-0.5, 0.5),
-                "scale": random.uniform(0.5, 1.5),
-                "alpha": random.randint(30, 100),
-            }
+        # Motion state as parallel arrays, one entry per piece
+        self._bg_x = np.random.randint(-100, SCREEN_WIDTH - 49, count).astype(
+            np.float32
+        )
+        self._bg_y = np.random.randint(-200, -49, count).astype(np.float32)
+        self._bg_rotation = np.random.randint(0, 4, count).astype(np.float32)
+        self._bg_speed = np.random.uniform(15, 30, count).astype(np.float32)
+        self._bg_rotation_speed = np.random.uniform(-0.5, 0.5, count).astype(
+            np.float32
+        )
 
-            self.bg_tetrominos.append(tetromino)
+        # Offset of each sprite's center from the piece origin, in pixels
+        centers = np.array(
+            [self._tetromino_sprites[t.sprite_idx][1] for t in self.bg_tetrominos],
+            dtype=np.float32,
+        )
+        cell_sizes = BG_TETROMINO_CELL * np.array(
+            [t.scale for t in self.bg_tetrominos], dtype=np.float32
+        )
+        self._bg_center_x = centers[:, 0] * cell_sizes
+        self._bg_center_y = centers[:, 1] * cell_sizes
 
     def _create_main_menu_buttons(self):
         """Create buttons for main menu with improved look"""
@@ -967,7 +1369,7 @@ class MainMenu:
                 BUTTON_HEIGHT,
                 item,
                 self.medium_font,
-                action=lambda idx=i: self._handle_menu_click(idx),
+                action=partial(self._handle_menu_click, i),
                 bg_color=bg_color,
                 hover_color=hover_color,
                 border_color=UI_BORDER,
@@ -977,22 +1379,25 @@ class MainMenu:
     def _handle_menu_click(self, index):
         """Handle main menu button click with transition animation"""
         self.selected_item = index
-        try:
-            self.sound_manager.play_sound("menu_select")
-        except:
-            pass
-
-        if self.menu_items[index] == "Play Game":
-            self._set_transition("play")
-        elif self.menu_items[index] == "How to Play":
-            self._set_transition("howto")
-        elif self.menu_items[index] == "Settings":
-            self._set_transition("settings")
-        elif self.menu_items[index] == "Leaderboard":
-            self._load_leaderboard()
-            self._set_transition("leaderboard")
-        elif self.menu_items[index] == "Exit":
-            pygame.event.post(pygame.event.Event(QUIT))
+        self.sound_manager.play_sound("menu_select")
+
+        action = self._menu_actions.get(self.menu_items[index])
+        if action:
+            action()
+
+    def _open_settings(self):
+        """Open the settings menu with freshly laid out values"""
+        self._settings_dirty = True
+        self._set_transition("settings")
+
+    def _open_leaderboard(self):
+        """Open the leaderboard menu, (re)loading its scores"""
+        self._load_leaderboard()
+        self._set_transition("leaderboard")
+
+    def _exit_game(self):
+        """Ask the main loop to quit (checked right after event handling)"""
+        self.should_quit = True
 
     def _set_transition(self, target, callback=None):
         """Set up menu transition animation"""
@@ -1003,11 +1408,35 @@ class MainMenu:
 
     def _show_notification(self, text, color=(255, 255, 255), duration=3.0):
         """Show a notification message"""
+        text_surf = self.medium_font.render(text, True, color)
+
+        # Create background surface
+        padding = 20
+        width = text_surf.get_width() + padding * 2
+        height = text_surf.get_height() + padding * 2
+
+        notify_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        # Border as a filled rect, then the semi-transparent dark background
+        # inset over it (draw.rect overwrites alpha, so only a 2px ring of
+        # border stays and no outline pass is needed)
+        pygame.draw.rect(
+            notify_surface, color[:3], (0, 0, width, height), border_radius=10
+        )
+        pygame.draw.rect(
+            notify_surface,
+            (20, 20, 30, 200),
+            (2, 2, width - 4, height - 4),
+            border_radius=8,
+        )
+        notify_surface.blit(text_surf, (padding, padding))
+
         self.notification = {
             "text": text,
             "color": color,
             "timer": duration,
             "duration": duration,
+            # Rendered once here; only the fade (set_alpha) changes per frame
+            "surface": notify_surface.convert_alpha(),
         }
 
     def _play_as_guest(self):
@@ -1019,18 +1448,12 @@ class MainMenu:
     def _back_to_main(self):
         """Go back to main menu with transition"""
         self._set_transition("main")
-        try:
-            self.sound_manager.play_sound("menu_change")
-        except:
-            pass
+        self.sound_manager.play_sound("menu_change")
 
     def _switch_to_register(self):
         """Switch to registration screen with transition"""
         self._set_transition("register")
-        try:
-            self.sound_manager.play_sound("menu_change")
-        except:
-            pass
+        self.sound_manager.play_sound("menu_change")
 
     def _create_background(self):
         """
@@ -1042,28 +1465,27 @@ class MainMenu:
         # Create new surface
         bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-        # Modern gradient background
-        for y in range(SCREEN_HEIGHT):
-            # Map y position to color intensity
-            factor = 1 - (y / SCREEN_HEIGHT)
-            color = (
-                int(UI_BG[0] + factor * 15),  # Subtle gradient
-                int(UI_BG[1] + factor * 10),
-                int(max(5, UI_BG[2] - factor * 10)),
-            )
-            pygame.draw.line(bg, color, (0, y), (SCREEN_WIDTH, y))
+        # Modern gradient background, computed per row with NumPy
+        # (pixel array is indexed [x, y, channel] like pygame.surfarray)
+        factor = 1 - np.arange(SCREEN_HEIGHT) / SCREEN_HEIGHT
+        row_colors = np.stack(
+            (
+                UI_BG[0] + factor * 15,  # Subtle gradient
+                UI_BG[1] + factor * 10,
+                np.maximum(5, UI_BG[2] - factor * 10),
+            ),
+            axis=1,
+        ).astype(np.uint8)
+        pixels = np.empty((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+        pixels[:] = row_colors
 
-        # Add subtle grid pattern
-        grid_color = (30, 30, 40, 15)  # Very subtle grid
+        # Add subtle grid pattern (background is opaque, so only RGB applies)
+        grid_color = (30, 30, 40)  # Very subtle grid
         grid_spacing = 30
+        pixels[::grid_spacing, :] = grid_color  # Vertical grid lines
+        pixels[:, ::grid_spacing] = grid_color  # Horizontal grid lines
 
-        # Draw vertical grid lines
-        for x in range(0, SCREEN_WIDTH, grid_spacing):
-            pygame.draw.line(bg, grid_color, (x, 0), (x, SCREEN_HEIGHT), 1)
-
-        # Draw horizontal grid lines
-        for y in range(0, SCREEN_HEIGHT, grid_spacing):
-            pygame.draw.line(bg, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
+        pygame.surfarray.blit_array(bg, pixels)
 
         # Add a subtle DENSO branding element in the corner
         logo_surface = pygame.Surface((200, 100), pygame.SRCALPHA)
@@ -1074,127 +1496,226 @@ class MainMenu:
         # Add to bottom right corner
         bg.blit(logo_surface, (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 100))
 
-        return bg
-
-    def _load_leaderboard(self):
-        """Load leaderboard data with error handling"""
-        try:
-            if DB_AVAILABLE:
-                self.leaderboard_data = get_top_scores(10)
-                if not self.leaderboard_data:
-                    self._show_notification(
-                        "No scores found in leaderboard", (255, 200, 100)
-                    )
-            else:
-                self.leaderboard_data = []
-                self._show_notification(
-                    "Database not available - leaderboard disabled", (255, 200, 100)
-                )
-        except Exception as e:
-            self.logger.error(f"Could not load leaderboard: {e}")
-            self._show_notification("Error loading leaderboard data", (255, 100, 100))
-            self.leaderboard_data = []
+        return bg.convert()
 
-    def handle_event(self, event):
+    def _create_title_glow(self):
         """
-        Handle input events
-
-        Args:
-            event (pygame.event.Event): Event to handle
+        Pre-render the soft glow drawn over the "DENSO" title
 
         Returns:
-            bool: True if event was handled, False if not
+            pygame.Surface: Glow surface, tightly sized around the text
         """
-        # Store event for button updates
-        self.current_events = [event]
+        glow_denso = self.title_font.render("DENSO", True, DENSO_RED)
+        spread = TITLE_GLOW_SPREAD
 
-        # Handle button hover sound (only once per button)
-        if event.type == MOUSEMOTION:
-            self._check_button_hover()
+        glow_surface = pygame.Surface(
+            (glow_denso.get_width() + spread * 2, glow_denso.get_height() + spread * 2),
+            pygame.SRCALPHA,
+        )
+        glow_surface.blit(glow_denso, (spread, spread))
+
+        # Apply blur effect (simplified) in a single batched call. All copies
+        # share one source and one blend flag, which pygame-ce's fblits takes
+        # once for the whole batch.
+        positions = [(spread + dx, spread + dy) for dx, dy in TITLE_GLOW_OFFSETS]
+        if hasattr(glow_surface, "fblits"):
+            glow_surface.fblits(
+                [(glow_denso, pos) for pos in positions], pygame.BLEND_RGBA_ADD
+            )
+        else:
+            glow_surface.blits(
+                [(glow_denso, pos, None, pygame.BLEND_RGBA_ADD) for pos in positions],
+                doreturn=False,
+            )
 
-        # Skip event handling during transitions
-        if self.transition_state > 0 and self.transition_direction > 0:
-            # Only allow quit events during transitions
+        return glow_surface.convert_alpha()
+
+    def _load_leaderboard(self):
+        """Load leaderboard data with error handling"""
+        # Reopening the leaderboard shortly after a load reuses those rows
+        if (
+            self.leaderboard_data
+            and self._lb_loaded_at is not None
+            and time.monotonic() - self._lb_loaded_at < LEADERBOARD_CACHE_SECONDS
+        ):
+            return
+
+        if not DB_AVAILABLE:
+            self._lb_dirty = True
+            self.leaderboard_data = []
+            self._show_notification(
+                "Database not available - leaderboard disabled", (255, 200, 100)
+            )
+            return
+
+        # Query on a worker thread so the menu keeps animating; the rows
+        # arrive as a LEADERBOARD_LOADED event
+        if not self._lb_loading:
+            self._lb_loading = True
+            self._lb_dirty = True
+            threading.Thread(
+                target=self._fetch_leaderboard, name="leaderboard", daemon=True
+            ).start()
+
+    @staticmethod
+    def _fetch_leaderboard():
+        """Fetch the top scores and post them back to the event queue"""
+        # Runs off the main thread; the SQLite fallback engine relies on
+        # check_same_thread=False (see db.session) to allow that
+        try:
+            with _DB_LOCK:
+                rows = get_top_scores(LEADERBOARD_ROWS)
+        except Exception as e:
+            pygame.event.post(pygame.event.Event(LEADERBOARD_LOADED, error=e))
+        else:
+            pygame.event.post(pygame.event.Event(LEADERBOARD_LOADED, rows=rows))
+
+    def _on_leaderboard_loaded(self, event):
+        """
+        Take over the rows fetched by the leaderboard worker
+
+        Args:
+            event (pygame.event.Event): LEADERBOARD_LOADED event
+        """
+        self._lb_loading = False
+        self._lb_dirty = True
+        error = getattr(event, "error", None)
+        if error is not None:
+            self.logger.error(f"Could not load leaderboard: {error}")
+            self._show_notification("Error loading leaderboard data", (255, 100, 100))
+            self.leaderboard_data = []
+            return
+
+        self.leaderboard_data = event.rows
+        self._lb_loaded_at = time.monotonic()
+        if not self.leaderboard_data:
+            self._show_notification("No scores found in leaderboard", (255, 200, 100))
+
+    def handle_events(self, events):
+        """
+        Handle all input events gathered for one frame
+
+        Args:
+            events (list): Events from pygame.event.get()
+
+        Returns:
+            bool: True if any event was handled, False if not
+        """
+        # Query the mouse once for the whole batch
+        self.mouse_pos = pygame.mouse.get_pos()
+
+        handled = False
+        for event in events:
+            handled = self._dispatch_event(event) or handled
+        return handled
+
+    def handle_event(self, event):
+        """
+        Handle a single input event
+
+        Args:
+            event (pygame.event.Event): Event to handle
+
+        Returns:
+            bool: True if event was handled, False if not
+        """
+        return self.handle_events((event,))
+
+    def _dispatch_event(self, event):
+        """
+        Route one event to the handler of the current menu
+
+        Args:
+            event (pygame.event.Event): Event to handle
+
+        Returns:
+            bool: True if event was handled, False if not
+        """
+        if event.type == LEADERBOARD_LOADED:
+            self._on_leaderboard_loaded(event)
+            return True
+
+        if event.type == AUTH_DONE:
+            self._on_auth_done(event)
+            return True
+
+        # Defer the hover sound check to update() so it runs once per frame
+        # no matter how many motion events arrive
+        if event.type == MOUSEMOTION:
+            self._mouse_moved = True
+
+        # Skip event handling during transitions
+        if self.transition_state > 0 and self.transition_direction > 0:
+            # Only allow quit events during transitions
             if event.type == QUIT:
                 return True
             return False
 
+        # Buttons only ever need to see left clicks
+        if event.type == MOUSEBUTTONDOWN and event.button == 1:
+            clicks = (event,)
+        else:
+            clicks = ()
+
         # Handle menu-specific events
-        if self.current_menu == "main":
-            return self._handle_main_menu_event(event)
-        elif self.current_menu == "play":
-            return self._handle_play_menu_event(event)
-        elif self.current_menu == "register":
-            return self._handle_register_menu_event(event)
-        elif self.current_menu == "howto":
-            return self._handle_howto_menu_event(event)
-        elif self.current_menu == "settings":
-            return self._handle_settings_menu_event(event)
-        elif self.current_menu == "leaderboard":
-            return self._handle_leaderboard_menu_event(event)
+        handler = self._event_dispatch.get(self.current_menu)
+        if handler:
+            return handler(event, clicks)
 
         return False
 
-    def _check_button_hover(self):
-        """Check for button hover to play sound effects"""
-        mouse_pos = pygame.mouse.get_pos()
+    def _hit_test(self, mouse_pos):
+        """
+        Find the button of the current menu that is under the cursor
 
-        # Check which set of buttons to use
-        buttons = []
-        if self.current_menu == "main":
-            buttons = self.main_menu_buttons
-        elif self.current_menu == "play":
-            buttons = [
-                self.login_button,
-                self.register_button,
-                self.play_as_guest_button,
-                self.back_button,
-            ]
-        elif self.current_menu == "register":
-            buttons = [self.create_account_button, self.back_button]
-        elif self.current_menu in ["howto", "settings", "leaderboard"]:
-            buttons = [self.back_button]
-
-        # Check each button
-        for button in buttons:
-            was_hovered = button.hovered
-            is_hovered = button.rect.collidepoint(mouse_pos)
-
-            # Play sound when first hovering over a button
-            if not was_hovered and is_hovered:
-                try:
-                    self.sound_manager.play_sound("menu_change")
-                except:
-                    pass
-
-    def _handle_main_menu_event(self, event):
+        Buttons never overlap, so at most one can be hit and all of them are
+        tested in a single collidelist call.
+
+        Args:
+            mouse_pos: Mouse position to test
+
+        Returns:
+            int: Index into the current menu's buttons, or -1 if none is hit
+        """
+        return pygame.Rect(mouse_pos, (1, 1)).collidelist(
+            self._button_rects_by_menu.get(self.current_menu, ())
+        )
+
+    def _check_button_hover(self, buttons, hit):
+        """
+        Check for button hover to play sound effects
+
+        Args:
+            buttons: Buttons of the current menu
+            hit: Index of the button under the cursor (see _hit_test), or -1
+        """
+        # Play sound when first hovering over a button
+        if hit != -1 and not buttons[hit].hovered:
+            self.sound_manager.play_sound("menu_change")
+
+    def _handle_main_menu_event(self, event, clicks):
         """Handle events in main menu"""
         # Check keyboard navigation
         if event.type == KEYDOWN:
             if event.key == K_UP:
                 self.selected_item = (self.selected_item - 1) % len(self.menu_items)
-                try:
-                    self.sound_manager.play_sound("menu_change")
-                except:
-                    pass
+                self.sound_manager.play_sound("menu_change")
             elif event.key == K_DOWN:
                 self.selected_item = (self.selected_item + 1) % len(self.menu_items)
-                try:
-                    self.sound_manager.play_sound("menu_change")
-                except:
-                    pass
+                self.sound_manager.play_sound("menu_change")
             elif event.key == K_RETURN:
                 # Same as clicking the selected button
                 return self._handle_menu_click(self.selected_item)
 
         # Check button clicks
-        for i, button in enumerate(self.main_menu_buttons):
-            if button.update(self.current_events):
-                return True
+        if clicks:
+            for button in self.main_menu_buttons:
+                if button.update(clicks, self.mouse_pos):
+                    return True
 
         return False
 
-    def _handle_play_menu_event(self, event):
+    def _handle_play_menu_event(self, event, clicks):
         """Handle events in play/login menu"""
         # Handle input fields
         input_handled = False
@@ -1208,20 +1729,11 @@ class MainMenu:
             elif self.password_input.active:
                 self.active_input = "password"
 
-        # Handle button clicks
-        if self.login_button.update(self.current_events):
-            return self._handle_login()
-
-        if self.register_button.update(self.current_events):
-            self._switch_to_register()
-            return True
-
-        if self.play_as_guest_button.update(self.current_events):
-            return self._play_as_guest()
-
-        if self.back_button.update(self.current_events):
-            self._back_to_main()
-            return True
+        # Handle button clicks (each button runs its own action when clicked)
+        if clicks:
+            for button in self._buttons_by_menu["play"]:
+                if button.update(clicks, self.mouse_pos):
+                    return True
 
         # Keyboard navigation
         if event.type == KEYDOWN:
@@ -1235,7 +1747,7 @@ class MainMenu:
 
         return False
 
-    def _handle_register_menu_event(self, event):
+    def _handle_register_menu_event(self, event, clicks):
         """Handle events in registration menu"""
         # Handle input fields
         input_handled = False
@@ -1252,26 +1764,21 @@ class MainMenu:
             elif self.email_input.active:
                 self.active_input = "email"
 
-        # Handle button clicks
-        if self.create_account_button.update(self.current_events):
-            return self._handle_register()
+        # Handle button clicks (create_account_button runs _handle_register)
+        if clicks:
+            if self.create_account_button.update(clicks, self.mouse_pos):
+                return True
 
-        if self.back_button.update(self.current_events):
-            self._set_transition("play")  # Go back to login screen
-            try:
+            if self.back_button.update(clicks, self.mouse_pos):
+                self._set_transition("play")  # Go back to login screen
                 self.sound_manager.play_sound("menu_change")
-            except:
-                pass
-            return True
+                return True
 
         # Keyboard navigation
         if event.type == KEYDOWN:
             if event.key == K_ESCAPE:
                 self._set_transition("play")  # Go back to login screen
-                try:
-                    self.sound_manager.play_sound("menu_change")
-                except:
-                    pass
+                self.sound_manager.play_sound("menu_change")
                 return True
             elif event.key == K_RETURN and not (
                 self.username_input.active
@@ -1282,10 +1789,10 @@ class MainMenu:
 
         return False
 
-    def _handle_howto_menu_event(self, event):
+    def _handle_howto_menu_event(self, event, clicks):
         """Handle events in how to play menu"""
         # Check button clicks
-        if self.back_button.update(self.current_events):
+        if clicks and self.back_button.update(clicks, self.mouse_pos):
             self._back_to_main()
             return True
 
@@ -1297,10 +1804,10 @@ class MainMenu:
 
         return False
 
-    def _handle_settings_menu_event(self, event):
+    def _handle_settings_menu_event(self, event, clicks):
         """Handle events in settings menu"""
         # Check button clicks
-        if self.back_button.update(self.current_events):
+        if clicks and self.back_button.update(clicks, self.mouse_pos):
             self._back_to_main()
             return True
 
@@ -1312,10 +1819,10 @@ class MainMenu:
 
         return False
 
-    def _handle_leaderboard_menu_event(self, event):
+    def _handle_leaderboard_menu_event(self, event, clicks):
         """Handle events in leaderboard menu"""
         # Check button clicks
-        if self.back_button.update(self.current_events):
+        if clicks and self.back_button.update(clicks, self.mouse_pos):
             self._back_to_main()
             return True
 
@@ -1343,57 +1850,41 @@ class MainMenu:
             self._show_notification("Please enter your password", (255, 100, 100))
             return False
 
-        try:
-            if DB_AVAILABLE:
-                # Authenticate
-                if authenticate_user(username, password):
-                    self.username = username
-                    self._show_notification(
-                        f"Login successful! Welcome {self.username}", (100, 255, 100)
-                    )
-                    try:
-                        self.sound_manager.play_sound("menu_select")
-                    except:
-                        pass
-
-                    # Load user settings
-                    try:
-                        settings = get_user_settings(self.username)
-                    except:
-                        settings = None
-
-                    # Start game with transition
-                    self._set_transition(
-                        "main", lambda: Game(self.screen, self.config, self.username)
-                    )
-                    return False  # Return False until transition completes
-                else:
-                    self.password_input.set_error("Invalid credentials")
-                    self._show_notification(
-                        "Invalid username or password", (255, 100, 100)
-                    )
-                    return False
-            else:
-                # In development mode, accept any login
-                self.username = username
-                self._show_notification(
-                    f"Login successful (dev mode)! Welcome {self.username}",
-                    (100, 255, 100),
-                )
-                try:
-                    self.sound_manager.play_sound("menu_select")
-                except:
-                    pass
-                self._set_transition(
-                    "main", lambda: Game(self.screen, self.config, self.username)
-                )
-                return False
-
-        except Exception as e:
-            self.logger.error(f"Error during login: {e}")
-            self._show_notification("Authentication system error", (255, 100, 100))
+        if DB_AVAILABLE:
+            # Authenticate off the UI thread, see _on_auth_done
+            self._start_auth("login", authenticate_user, username, password)
             return False
 
+        # In development mode, accept any login
+        self.username = username
+        self._show_notification(
+            f"Login successful (dev mode)! Welcome {self.username}",
+            (100, 255, 100),
+        )
+        self.sound_manager.play_sound("menu_select")
+        self._set_transition(
+            "main", partial(Game, self.screen, self.config, self.username)
+        )
+        return False
+
+    def _login_succeeded(self, username):
+        """
+        Greet a logged in player and start the game
+
+        Args:
+            username: Name the player logged in with
+        """
+        self.username = username
+        self._show_notification(
+            f"Login successful! Welcome {self.username}", (100, 255, 100)
+        )
+        self.sound_manager.play_sound("menu_select")
+
+        # Start game with transition
+        self._set_transition(
+            "main", partial(Game, self.screen, self.config, self.username)
+        )
+
     def _handle_register(self):
         """Handle registration attempt with validation"""
         username = self.username_input.text
@@ -1414,8 +1905,11 @@ class MainMenu:
             self.password_input.set_error("Password must be at least 6 characters")
             valid = False
 
-        if email and "@" not in email:
-            self.email_input.set_error("Invalid email format")
+        # The email field validates itself as it is typed
+        if email and not self.email_input.valid:
+            self.email_input.set_error(
+                self.email_input.error_message or "Invalid email format"
+            )
             valid = False
 
         if not valid:
@@ -1424,48 +1918,102 @@ class MainMenu:
             )
             return False
 
+        if DB_AVAILABLE:
+            # Register off the UI thread, see _on_auth_done
+            self._start_auth("register", register_user, username, password)
+            return True
+
+        # In development mode, accept any registration
+        self.username = username
+        self._show_notification("Registration successful (dev mode)!", (100, 255, 100))
+        self.sound_manager.play_sound("menu_select")
+        self._set_transition("play")
+        self.login_message = "Account created! You can now log in."
+        return True
+
+    def _registration_succeeded(self, username):
+        """
+        Confirm a new account and go back to the login screen
+
+        Args:
+            username: Name of the new account
+        """
+        self.username = username
+        self._show_notification("Registration successful!", (100, 255, 100))
+        self.sound_manager.play_sound("menu_select")
+
+        # Reset fields
+        self.username_input.text = username  # Keep username for login
+        self.password_input.text = ""
+        self.email_input.text = ""
+
+        # Switch back to login screen with transition
+        self._set_transition("play")
+        self.login_message = "Account created! You can now log in."
+
+    def _start_auth(self, action, check, username, password):
+        """
+        Run a login or registration database call on a worker thread
+
+        Args:
+            action: "login" or "register"
+            check: authenticate_user or register_user
+            username, password: Credentials to pass to check
+        """
+        # Ignore repeated submits while a request is in flight
+        if self._auth_pending:
+            return
+        self._auth_pending = True
+        threading.Thread(
+            target=self._run_auth,
+            args=(action, check, username, password),
+            name=action,
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _run_auth(action, check, username, password):
+        """Call check and post its outcome back to the event queue"""
         try:
-            if DB_AVAILABLE:
-                # Register new user
-                if register_user(username, password):
-                    self.username = username
-                    self._show_notification("Registration successful!", (100, 255, 100))
-                    try:
-                        self.sound_manager.play_sound("menu_select")
-                    except:
-                        pass
-
-                    # Reset fields
-                    self.username_input.text = username  # Keep username for login
-                    self.password_input.text = ""
-                    self.email_input.text = ""
-
-                    # Switch back to login screen with transition
-                    self._set_transition("play")
-                    self.login_message = "Account created! You can now log in."
-                    return True
-                else:
-                    self.username_input.set_error("Username already exists")
-                    self._show_notification("Username already exists", (255, 100, 100))
-                    return False
+            with _DB_LOCK:
+                ok = bool(check(username, password))
+        except Exception as e:
+            pygame.event.post(
+                pygame.event.Event(AUTH_DONE, action=action, username=username, error=e)
+            )
+        else:
+            pygame.event.post(
+                pygame.event.Event(AUTH_DONE, action=action, username=username, ok=ok)
+            )
+
+    def _on_auth_done(self, event):
+        """
+        Apply the outcome of a login or registration worker
+
+        Args:
+            event (pygame.event.Event): AUTH_DONE event
+        """
+        self._auth_pending = False
+        error = getattr(event, "error", None)
+
+        if event.action == "login":
+            if error is not None:
+                self.logger.error(f"Error during login: {error}")
+                self._show_notification("Authentication system error", (255, 100, 100))
+            elif event.ok:
+                self._login_succeeded(event.username)
             else:
-                # In development mode, accept any registration
-                self.username = username
-                self._show_notification(
-                    "Registration successful (dev mode)!", (100, 255, 100)
-                )
-                try:
-                    self.sound_manager.play_sound("menu_select")
-                except:
-                    pass
-                self._set_transition("play")
-                self.login_message = "Account created! You can now log in."
-                return True
+                self.password_input.set_error("Invalid credentials")
+                self._show_notification("Invalid username or password", (255, 100, 100))
 
-        except Exception as e:
-            self.logger.error(f"Error during registration: {e}")
+        elif error is not None:
+            self.logger.error(f"Error during registration: {error}")
             self._show_notification("Registration system error", (255, 100, 100))
-            return False
+        elif event.ok:
+            self._registration_succeeded(event.username)
+        else:
+            self.username_input.set_error("Username already exists")
+            self._show_notification("Username already exists", (255, 100, 100))
 
     def update(self, dt):
         """
@@ -1507,39 +2055,43 @@ class MainMenu:
                     self.transition_callback = None
                     return result
 
-        # Update input fields
-        self.username_input.update(dt)
-        self.password_input.update(dt)
-        self.email_input.update(dt)
-
-        # Update buttons with animation
-        if self.current_menu == "main":
-            for button in self.main_menu_buttons:
-                button.update([], dt)
-        elif self.current_menu == "play":
-            self.login_button.update([], dt)
-            self.register_button.update([], dt)
-            self.play_as_guest_button.update([], dt)
-            self.back_button.update([], dt)
-        elif self.current_menu == "register":
-            self.create_account_button.update([], dt)
-            self.back_button.update([], dt)
-        else:
-            self.back_button.update([], dt)
-
-        # Update background tetrominos
-        for tetromino in self.bg_tetrominos:
-            # Move downward
-            tetromino["y"] += tetromino["speed"] * dt
-
-            # Rotate if it has rotation speed
-            tetromino["rotation"] += tetromino["rotation_speed"] * dt
-
-            # Reset if it goes off screen
-            if tetromino["y"] > SCREEN_HEIGHT + 100:
-                tetromino["y"] = random.randint(-200, -50)
-                tetromino["x"] = random.randint(-100, SCREEN_WIDTH - 50)
-                tetromino["speed"] = random.uniform(15, 30)
+        # Update input fields (only the ones on the current screen)
+        if self.current_menu in ("play", "register"):
+            self.username_input.update(dt)
+            self.password_input.update(dt)
+            if self.current_menu == "register":
+                self.email_input.update(dt)
+
+        # Update buttons with animation, reusing the mouse position that
+        # handle_events sampled for this frame
+        mouse_pos = self.mouse_pos
+        buttons = self._buttons_by_menu.get(self.current_menu, ())
+        hit = self._hit_test(mouse_pos)
+
+        # Handle button hover sound (only once per button, and only on frames
+        # where the mouse moved, however many motion events arrived)
+        if self._mouse_moved:
+            self._mouse_moved = False
+            self._check_button_hover(buttons, hit)
+
+        for i, button in enumerate(buttons):
+            hovered = i == hit
+            # Skip buttons whose hover state is unchanged and fully animated
+            if hovered == button.hovered and button.animation_state == hovered:
+                continue
+            button.update((), mouse_pos, dt, hovered=hovered)
+
+        # Update background tetrominos (move and rotate all pieces at once)
+        self._bg_y += self._bg_speed * dt
+        self._bg_rotation += self._bg_rotation_speed * dt
+
+        # Reset the ones that went off screen
+        respawn = self._bg_y > SCREEN_HEIGHT + 100
+        if respawn.any():
+            count = int(respawn.sum())
+            self._bg_y[respawn] = np.random.randint(-200, -49, count)
+            self._bg_x[respawn] = np.random.randint(-100, SCREEN_WIDTH - 49, count)
+            self._bg_speed[respawn] = np.random.uniform(15, 30, count)
 
         # Update notification timer
         if self.notification["timer"] > 0:
@@ -1559,10 +2111,10 @@ class MainMenu:
 
         # Apply transition effect if active
         if self.transition_state > 0:
-            # Draw current menu with transition effect
-            menu_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
+            # Draw current menu with transition effect (into the reused
+            # transition buffer, cleared instead of reallocated)
+            menu_surface = self._transition_surface
+            menu_surface.fill((0, 0, 0, 0))
 
             if self.transition_direction > 0:
                 # Coming in
@@ -1601,31 +2153,26 @@ class MainMenu:
 
     def _render_bg_tetrominos(self):
         """Render background tetromino animations"""
-        for tetromino in self.bg_tetrominos:
-            cell_size = 20 * tetromino["scale"]
-
-            # Draw each block of the tetromino
-            for block_x, block_y in tetromino["shape"]:
-                # Apply rotation
-                angle = tetromino["rotation"] * math.pi / 2
-                rot_x = block_x * math.cos(angle) - block_y * math.sin(angle)
-                rot_y = block_x * math.sin(angle) + block_y * math.cos(angle)
-
-                x = tetromino["x"] + rot_x * cell_size
-                y = tetromino["y"] + rot_y * cell_size
-
-                color = tetromino["color"] + (tetromino["alpha"],)
-
-                # Draw block
-                rect = pygame.Rect(x, y, cell_size, cell_size)
-                pygame.draw.rect(self.screen, color, rect, border_radius=2)
-                pygame.draw.rect(
-                    self.screen,
-                    (*color[:3], tetromino["alpha"] // 2),
-                    rect,
-                    width=1,
-                    border_radius=2,
-                )
+        # Rotate every piece's center around its origin in one pass
+        angles = self._bg_rotation * (math.pi / 2)
+        cos_a = np.cos(angles)
+        sin_a = np.sin(angles)
+        xs = self._bg_x + self._bg_center_x * cos_a - self._bg_center_y * sin_a
+        ys = self._bg_y + self._bg_center_x * sin_a + self._bg_center_y * cos_a
+
+        # Screen y points down, so a positive angle turns clockwise
+        degrees = self._bg_rotation * -90
+
+        bg_blits = []
+        for tetromino, x, y, angle in zip(
+            self.bg_tetrominos, xs.tolist(), ys.tolist(), degrees.tolist()
+        ):
+            sprite = self._tetromino_sprites[tetromino.sprite_idx][0]
+            image = pygame.transform.rotozoom(sprite, angle, tetromino.scale)
+            image.set_alpha(tetromino.alpha)
+            bg_blits.append((image, image.get_rect(center=(x, y))))
+
+        self.screen.blits(bg_blits, doreturn=False)
 
     def _render_notification(self):
         """Render notification message with fade effect"""
@@ -1639,40 +2186,12 @@ class MainMenu:
         if alpha <= 0:
             return
 
-        # Create notification surface
-        font = self.medium_font
-        text = font.render(self.notification["text"], True, self.notification["color"])
-
-        # Create background surface
-        padding = 20
-        width = text.get_width() + padding * 2
-        height = text.get_height() + padding * 2
-
-        notify_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        # Semi-transparent dark background
-        bg_color = (20, 20, 30, min(200, alpha))
-        pygame.draw.rect(
-            notify_surface, bg_color, (0, 0, width, height), border_radius=10
-        )
-
-        # Add border
-        border_color = (*self.notification["color"][:3], alpha)
-        pygame.draw.rect(
-            notify_surface,
-            border_color,
-            (0, 0, width, height),
-            width=2,
-            border_radius=10,
-        )
-
-        # Add text with adjusted alpha
-        text_alpha = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-        text_alpha.fill((255, 255, 255, alpha))
-        text.blit(text_alpha, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-        notify_surface.blit(text, (padding, padding))
+        # Fade the pre-rendered box as a whole
+        notify_surface = self.notification["surface"]
+        notify_surface.set_alpha(alpha)
 
         # Position at bottom of screen
+        width, height = notify_surface.get_size()
         x = (SCREEN_WIDTH - width) // 2
         y = SCREEN_HEIGHT - height - 20
 
@@ -1687,136 +2206,158 @@ class MainMenu:
 
     def _render_menu_by_name(self, menu_name, surface):
         """Render a specific menu by name"""
-        if menu_name == "main":
-            self._render_main_menu(surface)
-        elif menu_name == "play":
-            self._render_play_menu(surface)
-        elif menu_name == "register":
-            self._render_register_menu(surface)
-        elif menu_name == "howto":
-            self._render_howto_menu(surface)
-        elif menu_name == "settings":
-            self._render_settings_menu(surface)
-        elif menu_name == "leaderboard":
-            self._render_leaderboard_menu(surface)
+        renderer = self._render_dispatch.get(menu_name)
+        if renderer:
+            renderer(surface)
+
+    def _get_text(self, text, font, color):
+        """
+        Get rendered text, rendering each (text, font, color) only once
+
+        Args:
+            text: Text to render
+            font: Font to render with
+            color: Text color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (text, font, color)
+        text_surf = self._text_cache.get(key)
+        if text_surf is None:
+            text_surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surf
+        return text_surf
+
+    def _place_text(self, text, font, color, **anchor):
+        """
+        Get rendered text with its top-left position for a fixed anchor
+
+        Args:
+            text: Text to render
+            font: Font to render with
+            color: Text color
+            **anchor: One Rect anchor, e.g. center=(x, y)
+
+        Returns:
+            tuple: (surface, (x, y)) pair, ready for Surface.blits
+        """
+        key = (text, font, color, *anchor.items())
+        placed = self._placed_text.get(key)
+        if placed is None:
+            text_surf = self._get_text(text, font, color)
+            placed = (text_surf, text_surf.get_rect(**anchor).topleft)
+            self._placed_text[key] = placed
+        return placed
+
+    def _draw_buttons(self, surface, buttons, selected=None):
+        """
+        Draw several buttons with a single batched blit
+
+        Args:
+            surface: Surface to draw on
+            buttons: Buttons to draw, in order
+            selected: Index of the keyboard-selected button, if any
+        """
+        button_blits = []
+        for i, button in enumerate(buttons):
+            # Change button appearance if selected by keyboard
+            if i == selected:
+                button_blits.extend(button.get_blits(SELECTED_BUTTON_COLORS))
+            else:
+                button_blits.extend(button.get_blits())
+        surface.blits(button_blits, doreturn=False)
 
     def _render_main_menu(self, surface):
         """Draw main menu with modern effects"""
-        # Draw game logo with animation
-        logo_scale = 1.0 + 0.05 * math.sin(self.animation_timer * 2 * math.pi)
+        # Both the title bob and the glow pulse follow the same phase
+        pulse = math.sin(self.animation_timer * 2 * math.pi)
 
         # Draw DENSO TETRIS title with modern styling
-        title_denso = self.title_font.render("DENSO", True, DENSO_RED)
-        title_tetris = self.title_font.render(" TETRIS", True, WHITE)
+        title_denso = self._title_denso
+        title_tetris = self._title_tetris
 
         # Position both parts with slight animation
         denso_rect = title_denso.get_rect(
             right=SCREEN_WIDTH // 2 + title_tetris.get_width() // 2,
-            centery=150 + math.sin(self.animation_timer * 2 * math.pi) * 5,
+            centery=150 + pulse * 5,
         )
         tetris_rect = title_tetris.get_rect(
             left=denso_rect.right,
             centery=150 + math.sin((self.animation_timer + 0.25) * 2 * math.pi) * 5,
         )
 
-        # Draw title parts
-        surface.blit(title_denso, denso_rect)
-        surface.blit(title_tetris, tetris_rect)
-
-        # Subtle glow effect for title
-        glow_intensity = int(80 + 50 * math.sin(self.animation_timer * 2 * math.pi))
-        glow_color = (DENSO_RED[0], DENSO_RED[1], DENSO_RED[2], glow_intensity)
-
-        # Create a temporary surface for the glow effect
-        glow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        glow_denso = self.title_font.render("DENSO", True, glow_color)
-        glow_rect = glow_denso.get_rect(center=(denso_rect.centerx, denso_rect.centery))
-        glow_surface.blit(glow_denso, glow_rect)
-
-        # Apply blur effect (simplified)
-        for i in range(3):
-            offset = i + 1
-            blur_rect = glow_rect.copy()
-            blur_rect.x += offset
-            glow_surface.blit(
-                glow_denso, blur_rect, special_flags=pygame.BLEND_RGBA_ADD
-            )
-            blur_rect = glow_rect.copy()
-            blur_rect.x -= offset
-            glow_surface.blit(
-                glow_denso, blur_rect, special_flags=pygame.BLEND_RGBA_ADD
-            )
-            blur_rect = glow_rect.copy()
-            blur_rect.y += offset
-            glow_surface.blit(
-                glow_denso, blur_rect, special_flags=pygame.BLEND_RGBA_ADD
-            )
-            blur_rect = glow_rect.copy()
-            blur_rect.y -= offset
-            glow_surface.blit(
-                glow_denso, blur_rect, special_flags=pygame.BLEND_RGBA_ADD
-            )
-
-        # Apply the glow
-        surface.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        # Title parts plus a subtle pulsing glow over the "DENSO" part, using
+        # the glow pre-rendered in _create_title_glow
+        self._title_glow.set_alpha(int(80 + 50 * pulse))
+        glow_dx, glow_dy = self._title_glow_offset
+        surface.blits(
+            (
+                (title_denso, denso_rect),
+                (title_tetris, tetris_rect),
+                (self._title_glow, (denso_rect.x + glow_dx, denso_rect.y + glow_dy)),
+            ),
+            doreturn=False,
+        )
 
-        # Draw buttons with selection highlight
-        for i, button in enumerate(self.main_menu_buttons):
-            # Change button appearance if selected by keyboard
-            if i == self.selected_item:
-                # Save original colors
-                orig_bg = button.bg_color
-                orig_hover = button.hover_color
-                orig_border = button.border_color
-
-                # Set selected appearance
-                button.bg_color = DENSO_RED
-                button.hover_color = DENSO_LIGHT_RED
-                button.border_color = WHITE
-
-                # Draw button
-                button.draw(surface)
-
-                # Restore original colors
-                button.bg_color = orig_bg
-                button.hover_color = orig_hover
-                button.border_color = orig_border
-            else:
-                button.draw(surface)
+        # Draw buttons with selection highlight in one batched blit
+        self._draw_buttons(surface, self.main_menu_buttons, self.selected_item)
 
         # Draw version and copyright info
         self._render_footer(surface)
 
     def _render_footer(self, surface):
         """Render the footer with version and copyright info"""
-        # Draw version text
-        version_text = self.tiny_font.render("Version 1.0", True, UI_SUBTEXT)
-        version_rect = version_text.get_rect(
-            bottomright=(SCREEN_WIDTH - 20, SCREEN_HEIGHT - 40)
-        )
-        surface.blit(version_text, version_rect)
+        if self._footer_username != self.username:
+            self._build_footer()
+        surface.blits(self._footer_blits, doreturn=False)
 
-        # Draw current player name
+    def _build_footer(self):
+        """Pre-render the footer text for the current player name"""
+        # Current player name (version and copyright never change)
         user_text = self.small_font.render(f"Player: {self.username}", True, UI_SUBTEXT)
         user_rect = user_text.get_rect(bottomleft=(20, SCREEN_HEIGHT - 40))
-        surface.blit(user_text, user_rect)
 
-        # Draw copyright with subtle animation
-        copyright_text = self.tiny_font.render(
-            "© 2025 Thammaphon Chittasuwanna (SDM)", True, UI_SUBTEXT
-        )
-        copyright_rect = copyright_text.get_rect(
-            midbottom=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20)
-        )
-        surface.blit(copyright_text, copyright_rect)
+        self._footer_blits = [
+            (self._version_surf, self._version_pos),
+            (user_text.convert_alpha(), user_rect.topleft),
+            (self._copyright_surf, self._copyright_pos),
+        ]
+        self._footer_username = self.username
+
+    def _get_line_glow(self, line_width):
+        """
+        Get the glow drawn around the animated separator line
+
+        The line only ever takes a few dozen widths, so each glow is
+        rendered once and reused.
+
+        Args:
+            line_width: Width of the separator line in pixels
+
+        Returns:
+            pygame.Surface: Glow surface, 20px wider than the line
+        """
+        glow_surf = self._line_glows.get(line_width)
+        if glow_surf is None:
+            glow_surf = pygame.Surface((line_width + 20, 10), pygame.SRCALPHA)
+            for i, glow_color in enumerate(LINE_GLOW_COLORS):
+                pygame.draw.line(
+                    glow_surf, glow_color, (10, 5 + i), (line_width + 10, 5 + i), 1
+                )
+                pygame.draw.line(
+                    glow_surf, glow_color, (10, 5 - i), (line_width + 10, 5 - i), 1
+                )
+            glow_surf = glow_surf.convert_alpha()
+            self._line_glows[line_width] = glow_surf
+        return glow_surf
 
     def _render_play_menu(self, surface):
         """Draw play/login menu with modern UI"""
         # Draw title with subtle animation
         y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
-        title = self.large_font.render("Login", True, WHITE)
+        title = self._get_text("Login", self.large_font, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150 + y_offset))
-        surface.blit(title, title_rect)
 
         # Draw animated separator line
         line_width = int(200 + math.sin(self.animation_timer * 2 * math.pi) * 20)
@@ -1829,38 +2370,15 @@ class MainMenu:
         )
 
         # Add glow to the line
-        glow_surf = pygame.Surface((line_width + 20, 10), pygame.SRCALPHA)
-        for i in range(5):
-            glow_alpha = max(0, 100 - i * 20)
-            pygame.draw.line(
-                glow_surf,
-                (*DENSO_RED, glow_alpha),
-                (10, 5 + i),
-                (line_width + 10, 5 + i),
-                1,
-            )
-            pygame.draw.line(
-                glow_surf,
-                (*DENSO_RED, glow_alpha),
-                (10, 5 - i),
-                (line_width + 10, 5 - i),
-                1,
-            )
-        surface.blit(glow_surf, (SCREEN_WIDTH // 2 - line_width // 2 - 10, 185))
-
-        # Draw subtitle
-        subtitle = self.medium_font.render(
-            "Sign in to save your scores", True, UI_SUBTEXT
+        glow_surf = self._get_line_glow(line_width)
+        glow_pos = (SCREEN_WIDTH // 2 - line_width // 2 - 10, 185)
+
+        # Draw the title, line glow and static chrome (subtitle and field
+        # labels) in one batch
+        surface.blits(
+            [(title, title_rect), (glow_surf, glow_pos), self._play_chrome],
+            doreturn=False,
         )
-        subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 220))
-        surface.blit(subtitle, subtitle_rect)
-
-        # Draw input field labels
-        username_label = self.small_font.render("Username:", True, UI_TEXT)
-        surface.blit(username_label, (SCREEN_WIDTH // 2 - 150, 260))
-
-        password_label = self.small_font.render("Password:", True, UI_TEXT)
-        surface.blit(password_label, (SCREEN_WIDTH // 2 - 150, 320))
 
         # Draw input fields
         self.username_input.draw(surface)
@@ -1873,15 +2391,14 @@ class MainMenu:
                 if "successful" in self.login_message
                 else (255, 100, 100)
             )
-            login_msg = self.small_font.render(self.login_message, True, message_color)
+            login_msg = _render_cached(
+                self.small_font, self.login_message, message_color
+            )
             login_msg_rect = login_msg.get_rect(center=(SCREEN_WIDTH // 2, 420))
             surface.blit(login_msg, login_msg_rect)
 
         # Draw buttons
-        self.login_button.draw(surface)
-        self.register_button.draw(surface)
-        self.play_as_guest_button.draw(surface)
-        self.back_button.draw(surface)
+        self._draw_buttons(surface, self._buttons_by_menu["play"])
 
         # Draw footer
         self._render_footer(surface)
@@ -1890,9 +2407,8 @@ class MainMenu:
         """Draw registration menu with modern UI"""
         # Draw title with subtle animation
         y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
-        title = self.large_font.render("Create Account", True, WHITE)
+        title = self._get_text("Create Account", self.large_font, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150 + y_offset))
-        surface.blit(title, title_rect)
 
         # Draw animated separator line
         line_width = int(200 + math.sin(self.animation_timer * 2 * math.pi) * 20)
@@ -1905,41 +2421,15 @@ class MainMenu:
         )
 
         # Add glow to the line (same as in play menu)
-        glow_surf = pygame.Surface((line_width + 20, 10), pygame.SRCALPHA)
-        for i in range(5):
-            glow_alpha = max(0, 100 - i * 20)
-            pygame.draw.line(
-                glow_surf,
-                (*DENSO_RED, glow_alpha),
-                (10, 5 + i),
-                (line_width + 10, 5 + i),
-                1,
-            )
-            pygame.draw.line(
-                glow_surf,
-                (*DENSO_RED, glow_alpha),
-                (10, 5 - i),
-                (line_width + 10, 5 - i),
-                1,
-            )
-        surface.blit(glow_surf, (SCREEN_WIDTH // 2 - line_width // 2 - 10, 185))
-
-        # Draw subtitle
-        subtitle = self.medium_font.render(
-            "Register to track your scores", True, UI_SUBTEXT
+        glow_surf = self._get_line_glow(line_width)
+        glow_pos = (SCREEN_WIDTH // 2 - line_width // 2 - 10, 185)
+
+        # Draw the title, line glow and static chrome (subtitle and field
+        # labels) in one batch
+        surface.blits(
+            [(title, title_rect), (glow_surf, glow_pos), self._register_chrome],
+            doreturn=False,
         )
-        subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 220))
-        surface.blit(subtitle, subtitle_rect)
-
-        # Draw input field labels
-        username_label = self.small_font.render("Username:", True, UI_TEXT)
-        surface.blit(username_label, (SCREEN_WIDTH // 2 - 150, 260))
-
-        password_label = self.small_font.render("Password:", True, UI_TEXT)
-        surface.blit(password_label, (SCREEN_WIDTH // 2 - 150, 320))
-
-        email_label = self.small_font.render("Email (optional):", True, UI_TEXT)
-        surface.blit(email_label, (SCREEN_WIDTH // 2 - 150, 380))
 
         # Draw input fields
         self.username_input.draw(surface)
@@ -1953,28 +2443,20 @@ class MainMenu:
                 if "successful" in self.register_message
                 else (255, 100, 100)
             )
-            register_msg = self.small_font.render(
-                self.register_message, True, message_color
+            register_msg = _render_cached(
+                self.small_font, self.register_message, message_color
             )
             register_msg_rect = register_msg.get_rect(center=(SCREEN_WIDTH // 2, 470))
             surface.blit(register_msg, register_msg_rect)
 
         # Draw buttons
-        self.create_account_button.draw(surface)
-        self.back_button.draw(surface)
+        self._draw_buttons(surface, (self.create_account_button, self.back_button))
 
         # Draw footer
         self._render_footer(surface)
 
-    def _render_howto_menu(self, surface):
-        """Draw how to play menu with modern UI"""
-        # Draw title with subtle animation
-        y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
-        title = self.large_font.render("How to Play", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100 + y_offset))
-        surface.blit(title, title_rect)
-
-        # Draw content
+    def _build_howto_panel(self):
+        """Pre-render the How to Play card with all of its help text"""
         help_texts = [
             ("Controls:", UI_HIGHLIGHT),
             ("- Left/Right Arrow: Move block", UI_TEXT),
@@ -1992,29 +2474,23 @@ class MainMenu:
             ("- Game ends when blocks reach the top", UI_TEXT),
         ]
 
-        # Create stylish card background
+        # Card geometry in screen coordinates
         card_width = 500
         card_height = 420
         card_x = (SCREEN_WIDTH - card_width) // 2
         card_y = 160
 
-        # Draw card with modern style
-        pygame.draw.rect(
-            surface,
-            (40, 40, 60),
-            (card_x, card_y, card_width, card_height),
-            border_radius=15,
-        )
-        pygame.draw.rect(
-            surface,
-            DENSO_RED,
-            (card_x, card_y, card_width, card_height),
-            width=2,
-            border_radius=15,
-        )
+        # The last lines run past the card, so the panel extends to the bottom
+        panel = pygame.Surface((card_width, SCREEN_HEIGHT - card_y), pygame.SRCALPHA)
+        panel.blit(self._create_card(card_width, card_height), (0, 0))
+
+        # Text positions in panel coordinates
+        item_x = SCREEN_WIDTH // 2 - 200 - card_x
+        header_x = SCREEN_WIDTH // 2 - 220 - card_x
 
         y_pos = 180
         for text, color in help_texts:
+            panel_y = y_pos - card_y
             if text.startswith("-"):
                 # Sub-item with animation for highlighted items
                 if "T-Spin" in text:
@@ -2022,17 +2498,17 @@ class MainMenu:
                     color = (DENSO_RED[0], DENSO_RED[1], DENSO_RED[2])
 
                 rendered_text = self.small_font.render(text, True, color)
-                surface.blit(rendered_text, (SCREEN_WIDTH // 2 - 200, y_pos))
+                panel.blit(rendered_text, (item_x, panel_y))
                 y_pos += 30
 
             elif text.startswith("Controls") or text.startswith("Game Rules"):
                 # Sub-header with modern styling
                 # Draw header background
-                header_rect = pygame.Rect(card_x + 20, y_pos - 5, card_width - 40, 36)
-                pygame.draw.rect(surface, (50, 50, 70), header_rect, border_radius=5)
+                header_rect = pygame.Rect(20, panel_y - 5, card_width - 40, 36)
+                pygame.draw.rect(panel, (50, 50, 70), header_rect, border_radius=5)
 
                 rendered_text = self.medium_font.render(text, True, color)
-                surface.blit(rendered_text, (SCREEN_WIDTH // 2 - 220, y_pos))
+                panel.blit(rendered_text, (header_x, panel_y))
                 y_pos += 40
 
             elif text == "":
@@ -2042,14 +2518,29 @@ class MainMenu:
             else:
                 # Normal text
                 rendered_text = self.medium_font.render(text, True, color)
-                surface.blit(rendered_text, (SCREEN_WIDTH // 2 - 220, y_pos))
+                panel.blit(rendered_text, (header_x, panel_y))
                 y_pos += 30
 
+        self._howto_panel = panel.convert_alpha()
+        self._howto_panel_pos = (card_x, card_y)
+        self._howto_back_y = y_pos + 50
+
+    def _render_howto_menu(self, surface):
+        """Draw how to play menu with modern UI"""
+        # Draw title with subtle animation
+        y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
+        title = self._get_text("How to Play", self.large_font, WHITE)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100 + y_offset))
+        surface.blit(title, title_rect)
+
+        # Card with the help text (static, pre-rendered)
+        surface.blit(self._howto_panel, self._howto_panel_pos)
+
         # Draw back button
-        self.back_button.rect.center = (SCREEN_WIDTH // 2, y_pos + 50)
-        self.back_button.text_rect = self.medium_font.render(
-            self.back_button.text, True, UI_TEXT
-        ).get_rect(center=self.back_button.rect.center)
+        self.back_button.rect.center = (SCREEN_WIDTH // 2, self._howto_back_y)
+        self.back_button.text_rect = self.back_button.text_surf.get_rect(
+            center=self.back_button.rect.center
+        )
         self.back_button.draw(surface)
 
         # Draw footer
@@ -2059,31 +2550,42 @@ class MainMenu:
         """Draw settings menu with modern UI"""
         # Draw title with subtle animation
         y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
-        title = self.large_font.render("Settings", True, WHITE)
+        title = self._get_text("Settings", self.large_font, WHITE)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100 + y_offset))
         surface.blit(title, title_rect)
 
         # Create stylish card background
         card_width = 500
-        card_height = 420
         card_x = (SCREEN_WIDTH - card_width) // 2
         card_y = 160
 
-        # Draw card with modern style
-        pygame.draw.rect(
-            surface,
-            (40, 40, 60),
-            (card_x, card_y, card_width, card_height),
-            border_radius=15,
-        )
-        pygame.draw.rect(
-            surface,
-            DENSO_RED,
-            (card_x, card_y, card_width, card_height),
-            width=2,
-            border_radius=15,
+        # Draw the pre-rendered card
+        surface.blit(self._settings_card, (card_x, card_y))
+
+        # Setting rows are only rebuilt when the settings may have changed
+        if self._settings_dirty:
+            self._rebuild_settings_blits(card_x, card_width)
+            self._settings_dirty = False
+        surface.blits(self._settings_blits, doreturn=False)
+
+        # Draw back button
+        self.back_button.rect.center = (SCREEN_WIDTH // 2, self._settings_back_y)
+        self.back_button.text_rect = self.back_button.text_surf.get_rect(
+            center=self.back_button.rect.center
         )
+        self.back_button.draw(surface)
+
+        # Draw footer
+        self._render_footer(surface)
 
+    def _rebuild_settings_blits(self, card_x, card_width):
+        """
+        Pre-render the settings rows from the current config
+
+        Args:
+            card_x: Left edge of the settings card
+            card_width: Width of the settings card
+        """
         # Settings list
         settings_list = [
             ("Theme:", self.config["graphics"]["theme"]),
@@ -2104,181 +2606,294 @@ class MainMenu:
             ("Sound Effects:", f"{int(self.config['audio']['sfx_volume'] * 100)}%"),
         ]
 
+        # Alternating row backgrounds
+        row_surfs = []
+        for row_color in ((50, 50, 70), (45, 45, 65)):
+            row = pygame.Surface((card_width - 40, 40), pygame.SRCALPHA)
+            pygame.draw.rect(row, row_color, row.get_rect(), border_radius=5)
+            row_surfs.append(row.convert_alpha())
+
         y_pos = 180
+        blits = []
         for i, (label, value) in enumerate(settings_list):
-            # Draw alternating row backgrounds
-            row_rect = pygame.Rect(card_x + 20, y_pos - 5, card_width - 40, 40)
-            row_color = (50, 50, 70) if i % 2 == 0 else (45, 45, 65)
-            pygame.draw.rect(surface, row_color, row_rect, border_radius=5)
+            blits.append((row_surfs[i % 2], (card_x + 20, y_pos - 5)))
 
-            # Draw setting label
-            label_text = self.medium_font.render(label, True, UI_TEXT)
-            surface.blit(label_text, (card_x + 30, y_pos))
+            # Setting label
+            label_text = self._get_text(label, self.medium_font, UI_TEXT)
+            blits.append((label_text, (card_x + 30, y_pos)))
 
-            # Draw setting value with DENSO red for emphasis
-            value_text = self.medium_font.render(value, True, UI_HIGHLIGHT)
+            # Setting value with DENSO red for emphasis
+            value_text = self._get_text(value, self.medium_font, UI_HIGHLIGHT)
             value_rect = value_text.get_rect(
                 midright=(
                     card_x + card_width - 30,
                     y_pos + label_text.get_height() // 2,
                 )
             )
-            surface.blit(value_text, value_rect)
+            blits.append((value_text, value_rect))
 
             y_pos += 50
 
         # Note about settings
-        note = self.small_font.render(
-            "* Changes will take effect in the next game", True, UI_SUBTEXT
+        note = self._get_text(
+            "* Changes will take effect in the next game", self.small_font, UI_SUBTEXT
         )
         note_rect = note.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 20))
-        surface.blit(note, note_rect)
+        blits.append((note, note_rect))
 
-        # Draw back button
-        self.back_button.rect.center = (SCREEN_WIDTH // 2, y_pos + 60)
-        self.back_button.text_rect = self.medium_font.render(
-            self.back_button.text, True, UI_TEXT
-        ).get_rect(center=self.back_button.rect.center)
-        self.back_button.draw(surface)
+        self._settings_blits = blits
+        self._settings_back_y = y_pos + 60
 
-        # Draw footer
-        self._render_footer(surface)
+    def _create_card(self, width, height):
+        """
+        Pre-render a rounded card background with a DENSO red border
 
-    def _render_leaderboard_menu(self, surface):
-        """Draw leaderboard menu with modern UI"""
-        # Draw title with subtle animation
-        y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
-        title = self.large_font.render("High Scores", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100 + y_offset))
-        surface.blit(title, title_rect)
+        Args:
+            width, height: Card dimensions
 
-        # Create stylish card background
-        card_width = 600
-        card_height = 420
-        card_x = (SCREEN_WIDTH - card_width) // 2
-        card_y = 160
+        Returns:
+            pygame.Surface: Card surface (corners are transparent)
+        """
+        card = pygame.Surface((width, height), pygame.SRCALPHA)
+        card_rect = card.get_rect()
 
         # Draw card with modern style
-        pygame.draw.rect(
-            surface,
-            (40, 40, 60),
-            (card_x, card_y, card_width, card_height),
-            border_radius=15,
+        pygame.draw.rect(card, (40, 40, 60), card_rect, border_radius=15)
+        pygame.draw.rect(card, DENSO_RED, card_rect, width=2, border_radius=15)
+        return card
+
+    def _compose_chrome(self, blits):
+        """
+        Compose static (surface, position) pairs into one tight surface
+
+        Args:
+            blits: (surface, (x, y)) pairs in screen coordinates
+
+        Returns:
+            tuple: (surface, (x, y)) pair, ready for Surface.blits
+        """
+        rects = [surf.get_rect(topleft=pos) for surf, pos in blits]
+        bounds = rects[0].unionall(rects[1:])
+        chrome = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        chrome.blits(
+            [
+                (surf, (rect.x - bounds.x, rect.y - bounds.y))
+                for (surf, _), rect in zip(blits, rects)
+            ],
+            doreturn=False,
         )
-        pygame.draw.rect(
-            surface,
-            DENSO_RED,
-            (card_x, card_y, card_width, card_height),
-            width=2,
-            border_radius=15,
+        return chrome.convert_alpha(), bounds.topleft
+
+    def _build_menu_chrome(self):
+        """Pre-render the static layout of the login, register and card menus"""
+        label_x = SCREEN_WIDTH // 2 - 150
+        username_label = (
+            self._get_text("Username:", self.small_font, UI_TEXT),
+            (label_x, 260),
+        )
+        password_label = (
+            self._get_text("Password:", self.small_font, UI_TEXT),
+            (label_x, 320),
         )
 
-        # Draw table header
-        header_y = 170
-        pygame.draw.rect(
-            surface,
-            (60, 60, 90),
-            (card_x + 10, header_y, card_width - 20, 50),
-            border_radius=8,
+        # Login: subtitle and field labels
+        self._play_chrome = self._compose_chrome(
+            [
+                self._place_text(
+                    "Sign in to save your scores",
+                    self.medium_font,
+                    UI_SUBTEXT,
+                    center=(SCREEN_WIDTH // 2, 220),
+                ),
+                username_label,
+                password_label,
+            ]
         )
 
-        # Column headers
-        rank_text = self.medium_font.render("Rank", True, UI_HIGHLIGHT)
-        rank_rect = rank_text.get_rect(center=(card_x + 60, header_y + 25))
-        surface.blit(rank_text, rank_rect)
+        # Register: subtitle and field labels (including email)
+        self._register_chrome = self._compose_chrome(
+            [
+                self._place_text(
+                    "Register to track your scores",
+                    self.medium_font,
+                    UI_SUBTEXT,
+                    center=(SCREEN_WIDTH // 2, 220),
+                ),
+                username_label,
+                password_label,
+                (
+                    self._get_text("Email (optional):", self.small_font, UI_TEXT),
+                    (label_x, 380),
+                ),
+            ]
+        )
 
-        name_text = self.medium_font.render("Player", True, UI_HIGHLIGHT)
-        name_rect = name_text.get_rect(center=(card_x + 200, header_y + 25))  # Fixed
-        surface.blit(name_text, name_rect)
+        # Settings and leaderboard cards (the leaderboard includes its header)
+        self._settings_card = self._create_card(500, 420).convert_alpha()
+        leaderboard_card = self._create_card(600, 420)
+        leaderboard_card.blit(self._lb_header_surf, (10, 10))
+        self._leaderboard_chrome = leaderboard_card.convert_alpha()
+
+    def _build_leaderboard_templates(self):
+        """Pre-render the leaderboard header, row backgrounds and medal ranks"""
+        width = 580  # Card width minus margins
+
+        # Row backgrounds with rounded corners baked in. The corners are
+        # hard-edged, so an opaque surface with a colorkey is enough and
+        # blits faster than per-pixel alpha.
+        def make_row(color):
+            row = pygame.Surface((width, 40))
+            row.fill(TEMPLATE_COLORKEY)
+            pygame.draw.rect(row, color, row.get_rect(), border_radius=5)
+            row = row.convert()
+            row.set_colorkey(TEMPLATE_COLORKEY, pygame.RLEACCEL)
+            return row
+
+        self._row_even = make_row((50, 50, 70))
+        self._row_odd = make_row((45, 45, 65))
+        self._row_highlight = make_row((70, 40, 50))  # DENSO red tint
+
+        # Header background with the column titles
+        header = pygame.Surface((width, 50), pygame.SRCALPHA)
+        pygame.draw.rect(header, (60, 60, 90), header.get_rect(), border_radius=8)
+        for title, x in (("Rank", 50), ("Player", 190), ("Score", 370), ("Level", 510)):
+            title_surf = self.medium_font.render(title, True, UI_HIGHLIGHT)
+            header.blit(title_surf, title_surf.get_rect(center=(x, 25)))
+        self._lb_header_surf = header.convert_alpha()
+
+        # Medal rank labels (emoji glyphs are slow to render)
+        self._medal_surfs = [
+            self.medium_font.render(text, True, color).convert_alpha()
+            for text, color in RANK_MEDALS
+        ]
 
-        score_text = self.medium_font.render("Score", True, UI_HIGHLIGHT)
-        score_rect = score_text.get_rect(center=(card_x + 380, header_y + 25))
-        surface.blit(score_text, score_rect)  # Fixed
+    def _rebuild_lb_blits(self, card_x, card_y, card_width, card_height):
+        """
+        Lay out the leaderboard rows for the current data and player
 
-        level_text = self.medium_font.render("Level", True, UI_HIGHLIGHT)
-        level_rect = level_text.get_rect(center=(card_x + 520, header_y + 25))
-        surface.blit(level_text, level_rect)
+        Args:
+            card_x, card_y: Top-left corner of the leaderboard card
+            card_width, card_height: Card dimensions
+        """
+        # Table header (part of the card chrome)
+        header_y = 170
 
-        # Draw data
-        if not self.leaderboard_data:
+        # Everything inside the card is drawn in one batch
+        blits = []
+
+        # Data rows
+        if not self.leaderboard_data and self._lb_loading:
+            blits.append(
+                self._place_text(
+                    "Loading scores...",
+                    self.medium_font,
+                    UI_TEXT,
+                    center=(card_x + card_width // 2, card_y + card_height // 2),
+                )
+            )
+
+        elif not self.leaderboard_data:
             # Show message when no data
-            no_data = self.medium_font.render("No score data available", True, UI_TEXT)
-            no_data_rect = no_data.get_rect(
-                center=(card_x + card_width // 2, card_y + card_height // 2)
+            blits.append(
+                self._place_text(
+                    "No score data available",
+                    self.medium_font,
+                    UI_TEXT,
+                    center=(card_x + card_width // 2, card_y + card_height // 2),
+                )
             )
-            surface.blit(no_data, no_data_rect)
 
             # Show hint
-            hint = self.small_font.render(
-                "Play a game to set your first score!", True, UI_SUBTEXT
-            )
-            hint_rect = hint.get_rect(
-                center=(card_x + card_width // 2, card_y + card_height // 2 + 40)
+            blits.append(
+                self._place_text(
+                    "Play a game to set your first score!",
+                    self.small_font,
+                    UI_SUBTEXT,
+                    center=(card_x + card_width // 2, card_y + card_height // 2 + 40),
+                )
             )
-            surface.blit(hint, hint_rect)
 
         else:
             y_pos = header_y + 60
-            for i, score in enumerate(self.leaderboard_data):
-                # Row background color - alternate for readability
-                row_color = (50, 50, 70) if i % 2 == 0 else (45, 45, 65)
+            for i, score in enumerate(self.leaderboard_data[:LEADERBOARD_ROWS]):
+                # Row background - alternate for readability
+                row_surf = self._row_even if i % 2 == 0 else self._row_odd
 
                 # Highlight user's score
                 if score.username == self.username:
-                    row_color = (70, 40, 50)  # DENSO red tint
-
-                # Draw row background
-                pygame.draw.rect(
-                    surface,
-                    row_color,
-                    (card_x + 10, y_pos - 5, card_width - 20, 40),
-                    border_radius=5,
-                )
+                    row_surf = self._row_highlight
+
+                blits.append((row_surf, (card_x + 10, y_pos - 5)))
 
                 # Rank (with medal icons for top 3)
-                rank_color = UI_TEXT
-                if i == 0:
-                    rank_text = "🥇 1"
-                    rank_color = (255, 215, 0)  # Gold
-                elif i == 1:
-                    rank_text = "🥈 2"
-                    rank_color = (192, 192, 192)  # Silver
-                elif i == 2:
-                    rank_text = "🥉 3"
-                    rank_color = (205, 127, 50)  # Bronze
+                if i < len(self._medal_surfs):
+                    rank = self._medal_surfs[i]
                 else:
-                    rank_text = f"{i+1}"
-
-                rank = self.medium_font.render(rank_text, True, rank_color)
+                    rank = self._get_text(f"{i+1}", self.medium_font, UI_TEXT)
                 rank_rect = rank.get_rect(centerx=card_x + 60, centery=y_pos + 15)
-                surface.blit(rank, rank_rect)
 
                 # Player name
                 name_color = DENSO_RED if score.username == self.username else UI_TEXT
-                name = self.medium_font.render(score.username, True, name_color)
+                name = self.medium_font.render(
+                    score.username, True, name_color
+                ).convert_alpha()
                 name_rect = name.get_rect(centerx=card_x + 200, centery=y_pos + 15)
-                surface.blit(name, name_rect)
 
                 # Score
-                score_value = self.medium_font.render(f"{score.score:,}", True, UI_TEXT)
+                score_value = self._get_text(
+                    _fmt_score(score.score), self.medium_font, UI_TEXT
+                )
                 score_rect = score_value.get_rect(
                     centerx=card_x + 380, centery=y_pos + 15
                 )
-                surface.blit(score_value, score_rect)
 
                 # Level
-                level = self.medium_font.render(f"{score.level}", True, UI_TEXT)
+                level = self._get_text(f"{score.level}", self.medium_font, UI_TEXT)
                 level_rect = level.get_rect(centerx=card_x + 520, centery=y_pos + 15)
-                surface.blit(level, level_rect)
+
+                blits.extend(
+                    (
+                        (rank, rank_rect),
+                        (name, name_rect),
+                        (score_value, score_rect),
+                        (level, level_rect),
+                    )
+                )
 
                 y_pos += 40
 
+        self._lb_blits = blits
+        self._lb_dirty = False
+        self._lb_username = self.username
+
+    def _render_leaderboard_menu(self, surface):
+        """Draw leaderboard menu with modern UI"""
+        # Draw title with subtle animation
+        y_offset = math.sin(self.animation_timer * 2 * math.pi) * 3
+        title = self._get_text("High Scores", self.large_font, WHITE)
+        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 100 + y_offset))
+        surface.blit(title, title_rect)
+
+        # Create stylish card background
+        card_width = 600
+        card_height = 420
+        card_x = (SCREEN_WIDTH - card_width) // 2
+        card_y = 160
+
+        # Draw the pre-rendered card with its table header
+        surface.blit(self._leaderboard_chrome, (card_x, card_y))
+
+        # Rows are only laid out again when the data or the player changes
+        if self._lb_dirty or self._lb_username != self.username:
+            self._rebuild_lb_blits(card_x, card_y, card_width, card_height)
+        surface.blits(self._lb_blits, doreturn=False)
+
         # Draw back button
         back_y = card_y + card_height + 30
         self.back_button.rect.center = (SCREEN_WIDTH // 2, back_y)
-        self.back_button.text_rect = self.medium_font.render(
-            self.back_button.text, True, UI_TEXT
-        ).get_rect(center=self.back_button.rect.center)
+        self.back_button.text_rect = self.back_button.text_surf.get_rect(
+            center=self.back_button.rect.center
+        )
         self.back_button.draw(surface)
 
         # Draw footer